@@ -15,6 +15,103 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
 
+/**
+ * commit_message_composer takes no arguments, so its messages are built once
+ */
+const COMMIT_MESSAGE_PROMPT = {
+	messages: [
+		{
+			role: "assistant" as const,
+			content: {
+				type: "text" as const,
+				text: `You are a git commit message expert who follows Conventional Commits specification and best practices for clear, meaningful commit messages that help teams understand project history.`,
+			},
+		},
+		{
+			role: "user" as const,
+			content: {
+				type: "text" as const,
+				text: `# Commit Message Composition Workflow
+
+## Step 1: Analyze Changes
+Use the \`git_command\` tool to examine what has changed:
+- Run: \`git status\` to see modified files
+- Run: \`git diff\` to see specific changes
+- Identify the scope and nature of changes
+
+## Step 2: Determine Commit Type
+Choose the appropriate type based on changes:
+- **feat**: New feature or functionality
+- **fix**: Bug fix
+- **docs**: Documentation changes only
+- **style**: Formatting, missing semicolons, etc. (no code change)
+- **refactor**: Code refactoring (no functional changes)
+- **perf**: Performance improvements
+- **test**: Adding or updating tests
+- **chore**: Build process, dependencies, tooling
+
+## Step 3: Identify Scope (Optional but Recommended)
+What part of the codebase is affected?
+- Component name (e.g., "auth", "api", "ui")
+- Module name (e.g., "parser", "validator")
+- Feature area (e.g., "search", "checkout")
+
+## Step 4: Write Concise Summary (≤50 chars)
+- Use imperative mood: "add" not "added" or "adds"
+- Don't capitalize first letter
+- No period at the end
+- Be specific but concise
+
+## Step 5: Add Body (If Needed)
+Include if changes are non-trivial:
+- Explain WHAT and WHY, not HOW
+- Wrap at 72 characters
+- Separate from summary with blank line
+- Use bullet points for multiple points
+
+## Step 6: Add Footer (If Applicable)
+- Breaking changes: \`BREAKING CHANGE: description\`
+- Issue references: \`Closes #123\`, \`Fixes #456\`
+- Co-authors: \`Co-authored-by: Name <email>\`
+
+## Format:
+\`\`\`
+<type>(<scope>): <summary>
+
+<body>
+
+<footer>
+\`\`\`
+
+## Examples:
+\`\`\`
+feat(auth): add two-factor authentication
+
+Implements TOTP-based 2FA for user accounts.
+- Add QR code generation for setup
+- Create verification endpoint
+- Update login flow to check 2FA status
+
+Closes #234
+\`\`\`
+
+\`\`\`
+fix(api): handle null response in user endpoint
+
+Previously crashed when user not found.
+Now returns 404 with appropriate message.
+\`\`\`
+
+\`\`\`
+docs(readme): update installation instructions
+\`\`\`
+
+Start by running \`git_command\` with \`git status\` and \`git diff\` to analyze changes, then compose an appropriate commit message.`,
+			},
+		},
+	],
+};
+
 /**
  * Register all workflow prompts with the MCP server
  *
@@ -127,101 +224,7 @@ Start by asking what code needs review, or use the tools to explore the codebase
 		"commit_message_composer",
 		"Guide for creating meaningful commit messages following Conventional Commits specification",
 		// eslint-disable-next-line @typescript-eslint/require-await
-		async () => {
-			return {
-				messages: [
-					{
-						role: "assistant" as const,
-						content: {
-							type: "text" as const,
-							text: `You are a git commit message expert who follows Conventional Commits specification and best practices for clear, meaningful commit messages that help teams understand project history.`,
-						},
-					},
-					{
-						role: "user" as const,
-						content: {
-							type: "text" as const,
-							text: `# Commit Message Composition Workflow
-
-## Step 1: Analyze Changes
-Use the \`git_command\` tool to examine what has changed:
-- Run: \`git status\` to see modified files
-- Run: \`git diff\` to see specific changes
-- Identify the scope and nature of changes
-
-## Step 2: Determine Commit Type
-Choose the appropriate type based on changes:
-- **feat**: New feature or functionality
-- **fix**: Bug fix
-- **docs**: Documentation changes only
-- **style**: Formatting, missing semicolons, etc. (no code change)
-- **refactor**: Code refactoring (no functional changes)
-- **perf**: Performance improvements
-- **test**: Adding or updating tests
-- **chore**: Build process, dependencies, tooling
-
-## Step 3: Identify Scope (Optional but Recommended)
-What part of the codebase is affected?
-- Component name (e.g., "auth", "api", "ui")
-- Module name (e.g., "parser", "validator")
-- Feature area (e.g., "search", "checkout")
-
-## Step 4: Write Concise Summary (≤50 chars)
-- Use imperative mood: "add" not "added" or "adds"
-- Don't capitalize first letter
-- No period at the end
-- Be specific but concise
-
-## Step 5: Add Body (If Needed)
-Include if changes are non-trivial:
-- Explain WHAT and WHY, not HOW
-- Wrap at 72 characters
-- Separate from summary with blank line
-- Use bullet points for multiple points
-
-## Step 6: Add Footer (If Applicable)
-- Breaking changes: \`BREAKING CHANGE: description\`
-- Issue references: \`Closes #123\`, \`Fixes #456\`
-- Co-authors: \`Co-authored-by: Name <email>\`
-
-## Format:
-\`\`\`
-<type>(<scope>): <summary>
-
-<body>
-
-<footer>
-\`\`\`
-
-## Examples:
-\`\`\`
-feat(auth): add two-factor authentication
-
-Implements TOTP-based 2FA for user accounts.
-- Add QR code generation for setup
-- Create verification endpoint
-- Update login flow to check 2FA status
-
-Closes #234
-\`\`\`
-
-\`\`\`
-fix(api): handle null response in user endpoint
-
-Previously crashed when user not found.
-Now returns 404 with appropriate message.
-\`\`\`
-
-\`\`\`
-docs(readme): update installation instructions
-\`\`\`
-
-Start by running \`git_command\` with \`git status\` and \`git diff\` to analyze changes, then compose an appropriate commit message.`,
-						},
-					},
-				],
-			};
-		}
+		async () => COMMIT_MESSAGE_PROMPT
 	);
 
 	// PROMPT 3: LIBRARY RESEARCH WORKFLOW
@@ -11,10 +11,10 @@
  */
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * Register git resources with the MCP server
@@ -31,8 +31,8 @@ export function registerGitResources(server: McpServer) {
 		},
 		async (uri) => {
 			try {
-				// Get git status
-				const { stdout } = await execAsync("git status", {
+				// Get git status (run git directly, no shell needed)
+				const { stdout } = await execFileAsync("git", ["status"], {
 					timeout: 10000,
 					maxBuffer: 1024 * 1024,
 				});
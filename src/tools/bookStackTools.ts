@@ -17,18 +17,16 @@ const BOOKSTACK_TOKEN_ID = process.env.BOOKSTACK_TOKEN_ID || "";
 const BOOKSTACK_TOKEN_SECRET = process.env.BOOKSTACK_TOKEN_SECRET || "";
 const API_BASE = BOOKSTACK_URL ? `${BOOKSTACK_URL.replace(/\/$/, "")}/api` : "";
 
-function authHeaders(): Record<string, string> {
-  return {
-    Authorization: `Token ${BOOKSTACK_TOKEN_ID}:${BOOKSTACK_TOKEN_SECRET}`,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  Authorization: `Token ${BOOKSTACK_TOKEN_ID}:${BOOKSTACK_TOKEN_SECRET}`,
+  "Content-Type": "application/json",
+};
 
 async function bookStackFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `${API_BASE}${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
@@ -41,9 +39,8 @@ async function bookStackFetch(method: string, path: string, body?: unknown): Pro
 }
 
 export function registerBookStackTools(server: McpServer): void {
-  const noKey = () => {
-    return { content: [{ type: "text" as const, text: "BOOKSTACK_URL, BOOKSTACK_TOKEN_ID or BOOKSTACK_TOKEN_SECRET not set in environment." }] };
-  };
+  const noKeyResult = { content: [{ type: "text" as const, text: "BOOKSTACK_URL, BOOKSTACK_TOKEN_ID or BOOKSTACK_TOKEN_SECRET not set in environment." }] };
+  const noKey = () => noKeyResult;
 
   // --- List shelves ---
   server.registerTool(
@@ -15,6 +15,25 @@ import { getSecurityConfig } from "../utils/security.js";
  * Register security tools with the MCP server
  */
 export function registerCommandTools(server: McpServer) {
+	// The security configuration is static for the life of the process,
+	// so build the response once instead of on every call.
+	const config = getSecurityConfig();
+	const statusText = `🔒 Security Configuration:
+
+Hardening Enabled: ${config.hardening_enabled ? "✅" : "❌"}
+Command Allowlist Active: ${config.command_allowlist_active ? "✅" : "❌"}
+Path Validation Active: ${config.path_validation_active ? "✅" : "❌"}
+Security Version: ${config.security_version}
+
+Allowed Commands (${config.allowed_commands.length}):
+${config.allowed_commands.map((cmd) => `  • ${cmd}`).join("\n")}
+
+Forbidden Paths (${config.forbidden_paths.length}):
+${config.forbidden_paths.map((p) => `  • ${p}`).join("\n")}
+
+Forbidden Directories (${config.forbidden_dirs.length}):
+${config.forbidden_dirs.map((d) => `  • ${d}`).join("\n")}`;
+
 	// SECURITY STATUS TOOL
 	server.registerTool(
 		"security_status",
@@ -33,27 +52,11 @@ export function registerCommandTools(server: McpServer) {
 			},
 		},
 		() => {
-			const config = getSecurityConfig();
-
 			return {
 				content: [
 					{
 						type: "text",
-						text: `🔒 Security Configuration:
-
-Hardening Enabled: ${config.hardening_enabled ? "✅" : "❌"}
-Command Allowlist Active: ${config.command_allowlist_active ? "✅" : "❌"}
-Path Validation Active: ${config.path_validation_active ? "✅" : "❌"}
-Security Version: ${config.security_version}
-
-Allowed Commands (${config.allowed_commands.length}):
-${config.allowed_commands.map((cmd) => `  • ${cmd}`).join("\n")}
-
-Forbidden Paths (${config.forbidden_paths.length}):
-${config.forbidden_paths.map((p) => `  • ${p}`).join("\n")}
-
-Forbidden Directories (${config.forbidden_dirs.length}):
-${config.forbidden_dirs.map((d) => `  • ${d}`).join("\n")}`,
+						text: statusText,
 					},
 				],
 				structuredContent: config,
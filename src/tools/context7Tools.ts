@@ -17,6 +17,102 @@ import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
 import { context7Limiter } from "../utils/cache.js";
 
+/**
+ * Static part of the resolve_library_id guidance
+ */
+const RESOLVE_GUIDANCE = `2. Context7 will return matching libraries with:
+   - Library ID (format: /org/project)
+   - Name and description
+   - Code snippet count
+   - Trust score (0-10)
+   - Available versions
+
+3. Choose the best match based on:
+   - Relevance to your query
+   - High trust score (7-10)
+   - Many code snippets (100+)
+   - Official documentation
+
+Example usage:
+- Search: "typescript sdk" → Returns MCP SDK, TypeScript docs
+- Search: "zod validation" → Returns Zod library documentation
+- Search: "nodejs api" → Returns Node.js API docs
+
+Once you have the library ID (e.g., /modelcontextprotocol/typescript-sdk),
+use the get_documentation tool to fetch specific documentation.`;
+
+/**
+ * Returned when get_documentation is given a malformed library ID
+ */
+const INVALID_LIBRARY_ID_TEXT = `Error: Invalid library ID format. Expected format: /org/project or /org/project/version
+
+Example valid IDs:
+- /modelcontextprotocol/sdk
+- /tc39/ecma262
+- /nodejs/nodejs.org
+- /facebook/react/v18.2.0`;
+
+/**
+ * Static part of the get_documentation guidance
+ */
+const DOCUMENTATION_GUIDANCE = `Usage Instructions:
+1. Use the library ID returned by resolve_library_id tool
+2. Optionally specify a topic for focused documentation
+3. Adjust token limit based on documentation length needed
+
+Example library IDs and topics:
+
+TypeScript/JavaScript Libraries:
+- /modelcontextprotocol/sdk → topic: "tools", "resources", "prompts"
+- /colinhacks/zod → topic: "validation", "schemas", "transforms"
+- /facebook/react → topic: "hooks", "components", "state"
+
+Documentation Libraries:
+- /nodejs/nodejs.org → topic: "async", "streams", "http"
+- /tc39/ecma262 → topic: "objects", "functions", "operators"
+- /microsoft/TypeScript → topic: "types", "generics", "decorators"
+
+The documentation returned will include:
+- Up-to-date, version-specific information
+- Code examples and patterns
+- API references with signatures
+- Common use cases and best practices
+
+For more libraries and topics, visit: https://context7.com`;
+
+/**
+ * Static part of the search_documentation guidance
+ */
+const SEARCH_GUIDANCE = `Search capabilities:
+1. Full-text search across all libraries
+2. Filter by category/technology
+3. Get relevance-ranked results
+4. View documentation snippets
+
+Common search queries:
+- "async/await" → Find async patterns across libraries
+- "error handling" → Error handling patterns
+- "typescript generics" → TypeScript-specific features
+- "state management" → React/Vue patterns
+- "authentication" → Auth patterns across frameworks
+
+Example categories:
+- typescript, javascript, python, rust
+- react, vue, angular, svelte
+- nodejs, express, fastapi
+- databases, testing, security
+
+Search results include:
+- Matching library (with library ID)
+- Relevance score (0-1)
+- Documentation snippet
+- Link to full documentation
+
+To view full documentation for a result:
+1. Note the library ID from the result
+2. Use get_documentation tool with that ID
+3. Optionally specify a topic for more focused docs`;
+
 /**
  * Register Context7 documentation tools with the MCP server
  *
@@ -87,26 +183,7 @@ export function registerContext7Tools(server: McpServer) {
 				const guidanceText = `To resolve library IDs in Context7:
 
 1. Search for your library: "${libraryName}"
-2. Context7 will return matching libraries with:
-   - Library ID (format: /org/project)
-   - Name and description
-   - Code snippet count
-   - Trust score (0-10)
-   - Available versions
-
-3. Choose the best match based on:
-   - Relevance to your query
-   - High trust score (7-10)
-   - Many code snippets (100+)
-   - Official documentation
-
-Example usage:
-- Search: "typescript sdk" → Returns MCP SDK, TypeScript docs
-- Search: "zod validation" → Returns Zod library documentation
-- Search: "nodejs api" → Returns Node.js API docs
-
-Once you have the library ID (e.g., /modelcontextprotocol/typescript-sdk),
-use the get_documentation tool to fetch specific documentation.`;
+${RESOLVE_GUIDANCE}`;
 
 				return {
 					content: [
@@ -195,13 +272,7 @@ For best results, provide specific library names like:
 						content: [
 							{
 								type: "text",
-								text: `Error: Invalid library ID format. Expected format: /org/project or /org/project/version
-							
-Example valid IDs:
-- /modelcontextprotocol/sdk
-- /tc39/ecma262
-- /nodejs/nodejs.org
-- /facebook/react/v18.2.0`,
+								text: INVALID_LIBRARY_ID_TEXT,
 							},
 						],
 						isError: true,
@@ -230,30 +301,7 @@ Example valid IDs:
 Library ID: ${libraryId}${topic ? `\nTopic Focus: ${topic}` : ""}
 Token Limit: ${tokens}
 
-Usage Instructions:
-1. Use the library ID returned by resolve_library_id tool
-2. Optionally specify a topic for focused documentation
-3. Adjust token limit based on documentation length needed
-
-Example library IDs and topics:
-
-TypeScript/JavaScript Libraries:
-- /modelcontextprotocol/sdk → topic: "tools", "resources", "prompts"
-- /colinhacks/zod → topic: "validation", "schemas", "transforms"
-- /facebook/react → topic: "hooks", "components", "state"
-
-Documentation Libraries:
-- /nodejs/nodejs.org → topic: "async", "streams", "http"
-- /tc39/ecma262 → topic: "objects", "functions", "operators"
-- /microsoft/TypeScript → topic: "types", "generics", "decorators"
-
-The documentation returned will include:
-- Up-to-date, version-specific information
-- Code examples and patterns
-- API references with signatures
-- Common use cases and best practices
-
-For more libraries and topics, visit: https://context7.com`;
+${DOCUMENTATION_GUIDANCE}`;
 
 				return {
 					content: [
@@ -353,35 +401,7 @@ Search Query: "${query}"${
 				}
 Max Results: ${maxResults}
 
-Search capabilities:
-1. Full-text search across all libraries
-2. Filter by category/technology
-3. Get relevance-ranked results
-4. View documentation snippets
-
-Common search queries:
-- "async/await" → Find async patterns across libraries
-- "error handling" → Error handling patterns
-- "typescript generics" → TypeScript-specific features
-- "state management" → React/Vue patterns
-- "authentication" → Auth patterns across frameworks
-
-Example categories:
-- typescript, javascript, python, rust
-- react, vue, angular, svelte
-- nodejs, express, fastapi
-- databases, testing, security
-
-Search results include:
-- Matching library (with library ID)
-- Relevance score (0-1)
-- Documentation snippet
-- Link to full documentation
-
-To view full documentation for a result:
-1. Note the library ID from the result
-2. Use get_documentation tool with that ID
-3. Optionally specify a topic for more focused docs`;
+${SEARCH_GUIDANCE}`;
 
 				return {
 					content: [
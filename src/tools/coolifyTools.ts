@@ -15,18 +15,16 @@ import { z } from "zod";
 const COOLIFY_URL = process.env.COOLIFY_URL || "https://coolify.deejpotter.com";
 const COOLIFY_TOKEN = process.env.COOLIFY_API_TOKEN || "";
 
-function authHeaders(): Record<string, string> {
-  return {
-    Authorization: `Bearer ${COOLIFY_TOKEN}`,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  Authorization: `Bearer ${COOLIFY_TOKEN}`,
+  "Content-Type": "application/json",
+};
 
 async function cfFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `${COOLIFY_URL}/api/v1${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
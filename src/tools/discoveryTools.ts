@@ -2,8 +2,34 @@ import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { join } from "path";
 import { readdir, readFile } from "fs/promises";
 import { makeStructuredError } from "../utils/errors.js";
+import { Cache } from "../utils/cache.js";
 import { z } from "zod";
 
+type DiscoveredTool = { name: string; file: string };
+
+const REGISTER_MARKER = "registerTool(";
+
+// The compiled tool set only changes on rebuild, so keep the scan result for
+// a minute instead of re-reading dist/tools on every discovery call.
+const discoveryCache = new Cache<DiscoveredTool[]>(60 * 1000);
+
+async function scanToolFile(
+  toolsDir: string,
+  fname: string
+): Promise<DiscoveredTool[]> {
+  const raw = await readFile(join(toolsDir, fname)).catch(() => null);
+  // Cheap byte scan first; only decode files that can contain a registration
+  if (!raw || !raw.includes(REGISTER_MARKER)) return [];
+  const txt = raw.toString("utf-8");
+  const re = /server\.registerTool\(\s*['"`]([^'"`]+)['"`]/g;
+  const found: DiscoveredTool[] = [];
+  let m;
+  while ((m = re.exec(txt))) {
+    found.push({ name: (m[1] as string) ?? "", file: fname });
+  }
+  return found;
+}
+
 export function registerDiscoveryTools(server: McpServer): void {
   server.registerTool(
     "mcp_tools_discovery",
@@ -23,18 +49,19 @@ export function registerDiscoveryTools(server: McpServer): void {
         const projectRoot = process.cwd();
         const toolsDir = join(projectRoot, "dist", "tools");
 
-        const entries = await readdir(toolsDir).catch(() => []);
-        const tools: Array<{ name: string; file: string }> = [];
-
-        for (const fname of entries) {
-          if (!fname.endsWith(".js") && !fname.endsWith(".cjs") && !fname.endsWith(".mjs")) continue;
-          const full = join(toolsDir, fname);
-          const txt = await readFile(full, "utf-8").catch(() => "");
-          const re = /server\.registerTool\(\s*['"`]([^'"`]+)['"`]/g;
-          let m;
-          while ((m = re.exec(txt))) {
-            tools.push({ name: (m[1] as string) ?? "", file: fname });
-          }
+        let tools = discoveryCache.get(toolsDir);
+        if (!tools) {
+          const entries = await readdir(toolsDir).catch(() => []);
+          const toolFiles = entries.filter(
+            (fname) => fname.endsWith(".js") || fname.endsWith(".cjs") || fname.endsWith(".mjs")
+          );
+
+          // Read files concurrently; results are flattened in directory order
+          const perFile = await Promise.all(
+            toolFiles.map((fname) => scanToolFile(toolsDir, fname))
+          );
+          tools = perFile.flat();
+          discoveryCache.set(toolsDir, tools);
         }
 
         return {
@@ -25,6 +25,28 @@ interface SearchResult {
 	position: number;
 }
 
+/**
+ * HTML entities decoded in result titles and snippets
+ */
+const HTML_ENTITIES: Record<string, string> = {
+	"&amp;": "&",
+	"&lt;": "<",
+	"&gt;": ">",
+	"&quot;": '"',
+	"&#x27;": "'",
+	"&#39;": "'",
+	"&nbsp;": " ",
+};
+
+const TAG_OR_ENTITY = /<[^>]*>|&(?:amp|lt|gt|quot|#x27|#39|nbsp);/g;
+
+/**
+ * Strip HTML tags and decode entities in a single pass
+ */
+function cleanHtml(text: string): string {
+	return text.replace(TAG_OR_ENTITY, (match) => HTML_ENTITIES[match] ?? "").trim();
+}
+
 /**
  * Register DuckDuckGo Search tools with the MCP server
  *
@@ -107,20 +129,6 @@ export function registerDuckDuckGoSearchTools(server: McpServer) {
 				const results: SearchResult[] = [];
 				let position = 1;
 
-				// Helper function to decode HTML entities and strip HTML tags
-				const cleanHtml = (text: string): string => {
-					return text
-						.replace(/<[^>]*>/g, "") // Strip HTML tags
-						.replace(/&amp;/g, "&")
-						.replace(/&lt;/g, "<")
-						.replace(/&gt;/g, ">")
-						.replace(/&quot;/g, '"')
-						.replace(/&#x27;/g, "'")
-						.replace(/&#39;/g, "'")
-						.replace(/&nbsp;/g, " ")
-						.trim();
-				};
-
 				// Extract result blocks - each result is in a div with class starting with "result"
 				const resultRegex =
 					/<div[^>]*class="result[^"]*"[^>]*>([\s\S]*?)<\/div>\s*<\/div>/g;
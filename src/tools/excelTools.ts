@@ -530,16 +530,15 @@ try {
 }
 $workbook = $excel.ActiveWorkbook
 if ($null -eq $workbook) { throw 'No active workbook found.' }
-$sheets = @()
-foreach ($worksheet in @($workbook.Worksheets)) {
+$sheets = @(foreach ($worksheet in @($workbook.Worksheets)) {
   $used = $worksheet.UsedRange
-  $sheets += [pscustomobject]@{
+  [pscustomobject]@{
     name = $worksheet.Name
     usedRange = if ($used) { $used.Address($false, $false) } else { $null }
     usedRows = if ($used) { [int]$used.Rows.Count } else { 0 }
     usedColumns = if ($used) { [int]$used.Columns.Count } else { 0 }
   }
-}
+})
 [pscustomobject]@{
   workbookName = $workbook.Name
   workbookPath = $workbook.Path
@@ -622,16 +621,18 @@ function Convert-ExcelValue($value) {
   if ($value -is [DateTime]) { return $value.ToString('o') }
   return $value
 }
-$rows = @()
+# PowerShell's array += copies the whole array on every append, so rows are
+# collected in a List and each row is filled into a preallocated array
+$rows = [System.Collections.Generic.List[object]]::new()
 if ($values -is [System.Array]) {
   $rowCount = $values.GetLength(0)
   $colCount = $values.GetLength(1)
   for ($r = 1; $r -le $rowCount; $r++) {
-    $row = @()
+    $row = [object[]]::new($colCount)
     for ($c = 1; $c -le $colCount; $c++) {
-      $row += ,(Convert-ExcelValue $values[$r, $c])
+      $row[$c - 1] = Convert-ExcelValue $values[$r, $c]
     }
-    $rows += ,$row
+    $rows.Add($row)
   }
 } else {
   $rows = @(@(Convert-ExcelValue $values))
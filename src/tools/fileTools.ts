@@ -10,10 +10,90 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
 import * as fs from "fs/promises";
+import { constants as fsConstants, type Stats } from "fs";
 import * as path from "path";
 import { glob } from "glob";
 import { validatePath } from "../utils/security.js";
 
+// Refuse to write through a symlink at the target itself. validatePath only
+// checks the path lexically, and O_NOFOLLOW covers just the final component:
+// symlinked parent directories are still followed. (O_NOFOLLOW is not
+// available on Windows, where it is simply left out.)
+const WRITE_FLAGS =
+	fsConstants.O_WRONLY |
+	fsConstants.O_CREAT |
+	fsConstants.O_TRUNC |
+	(fsConstants.O_NOFOLLOW ?? 0);
+
+// Open without blocking so a FIFO or device can be rejected by the isFile()
+// check instead of hanging in open(2) until a writer appears (O_NONBLOCK is
+// not available on Windows, where it is simply left out)
+const READ_FLAGS = fsConstants.O_RDONLY | (fsConstants.O_NONBLOCK ?? 0);
+
+/**
+ * Recently read files, most recently used last
+ */
+const readCache = new Map<
+	string,
+	{ mtimeMs: number; ctimeMs: number; ino: number; size: number; content: string }
+>();
+let readCacheBytes = 0;
+
+/**
+ * Total file bytes read_file keeps cached
+ */
+const READ_CACHE_MAX_BYTES = 8 * 1024 * 1024;
+
+/**
+ * Files modified this recently are not cached. A same-size rewrite within
+ * the filesystem's timestamp resolution would otherwise leave the stat
+ * fields unchanged and serve stale content.
+ */
+const READ_CACHE_SETTLE_MS = 2000;
+
+function getCachedRead(filePath: string, stats: Stats): string | undefined {
+	const cached = readCache.get(filePath);
+	if (!cached) return undefined;
+	if (
+		cached.mtimeMs !== stats.mtimeMs ||
+		cached.ctimeMs !== stats.ctimeMs ||
+		cached.ino !== stats.ino ||
+		cached.size !== stats.size
+	) {
+		readCache.delete(filePath);
+		readCacheBytes -= cached.size;
+		return undefined;
+	}
+	readCache.delete(filePath);
+	readCache.set(filePath, cached);
+	return cached.content;
+}
+
+function setCachedRead(filePath: string, stats: Stats, content: string): void {
+	if (Date.now() - Math.max(stats.mtimeMs, stats.ctimeMs) < READ_CACHE_SETTLE_MS) {
+		return;
+	}
+	if (stats.size > READ_CACHE_MAX_BYTES) return;
+	const previous = readCache.get(filePath);
+	if (previous) {
+		readCache.delete(filePath);
+		readCacheBytes -= previous.size;
+	}
+	readCache.set(filePath, {
+		mtimeMs: stats.mtimeMs,
+		ctimeMs: stats.ctimeMs,
+		ino: stats.ino,
+		size: stats.size,
+		content,
+	});
+	readCacheBytes += stats.size;
+	for (const [oldestPath, oldest] of readCache) {
+		if (readCacheBytes <= READ_CACHE_MAX_BYTES) break;
+		readCache.delete(oldestPath);
+		readCacheBytes -= oldest.size;
+	}
+}
+
 /**
  * Register file operation tools with the MCP server
  */
@@ -54,31 +134,46 @@ export function registerFileTools(server: McpServer) {
 					};
 				}
 
-				// Check file exists
-				const stats = await fs.stat(file_path);
+				// Open once and stat/read through the same handle, so the size
+				// check and the read see the same file
+				const handle = await fs.open(validation.resolvedPath!, READ_FLAGS);
+				let stats: Stats;
+				let content: string;
+				try {
+					stats = await handle.stat();
 
-				if (!stats.isFile()) {
-					return {
-						content: [{ type: "text", text: "❌ Path is not a file" }],
-						isError: true,
-					};
-				}
+					if (!stats.isFile()) {
+						return {
+							content: [{ type: "text", text: "❌ Path is not a file" }],
+							isError: true,
+						};
+					}
 
-				// Check file size
-				if (stats.size > max_size) {
-					return {
-						content: [
-							{
-								type: "text",
-								text: `🔒 File too large: ${stats.size} bytes exceeds ${max_size} bytes limit`,
-							},
-						],
-						isError: true,
-					};
-				}
+					// Check file size
+					if (stats.size > max_size) {
+						return {
+							content: [
+								{
+									type: "text",
+									text: `🔒 File too large: ${stats.size} bytes exceeds ${max_size} bytes limit`,
+								},
+							],
+							isError: true,
+						};
+					}
 
-				// Read file
-				const content = await fs.readFile(file_path, "utf-8");
+					// Reuse the last read while the file is unchanged
+					const resolvedPath = validation.resolvedPath!;
+					const cached = getCachedRead(resolvedPath, stats);
+					if (cached !== undefined) {
+						content = cached;
+					} else {
+						content = await handle.readFile("utf-8");
+						setCachedRead(resolvedPath, stats, content);
+					}
+				} finally {
+					await handle.close();
+				}
 				const output = {
 					content,
 					size: stats.size,
@@ -139,16 +234,40 @@ export function registerFileTools(server: McpServer) {
 				}
 
 				// Ensure directory exists
-				const dir = path.dirname(file_path);
-				await fs.mkdir(dir, { recursive: true });
+				const targetPath = path.resolve(file_path);
+				await fs.mkdir(path.dirname(targetPath), { recursive: true });
 
-				// Write file
-				await fs.writeFile(file_path, content, "utf-8");
-				const size = Buffer.byteLength(content, "utf-8");
+				// Write file through a handle opened without following a symlink
+				// at the target. Encode once; the byte length doubles as the
+				// reported size
+				const data = Buffer.from(content, "utf-8");
+				let handle: fs.FileHandle;
+				try {
+					handle = await fs.open(targetPath, WRITE_FLAGS);
+				} catch (error: unknown) {
+					if ((error as NodeJS.ErrnoException).code === "ELOOP") {
+						return {
+							content: [
+								{
+									type: "text",
+									text: `🔒 Security Error: refusing to write through a symlink: ${file_path}`,
+								},
+							],
+							isError: true,
+						};
+					}
+					throw error;
+				}
+				try {
+					await handle.writeFile(data);
+				} finally {
+					await handle.close();
+				}
+				const size = data.length;
 
 				const output = {
 					success: true,
-					path: path.resolve(file_path),
+					path: targetPath,
 					size,
 				};
 
@@ -242,13 +361,16 @@ export function registerFileTools(server: McpServer) {
 					absolute: true, // ensure validatePath sees absolute paths regardless of cwd
 				});
 
-				// Validate each file path
-				const validFiles = files
-					.map((f) => path.resolve(f))
-					.filter((file) => validatePath(file, "read").valid);
+				// Validate each file path in a single pass (glob already returns
+				// absolute paths, so no extra resolve is needed)
+				const validFiles: string[] = [];
+				for (const file of files) {
+					if (validatePath(file, "read").valid) validFiles.push(file);
+				}
+				validFiles.sort();
 
 				const output = {
-					files: validFiles.sort(),
+					files: validFiles,
 					count: validFiles.length,
 					directory: path.resolve(directory),
 				};
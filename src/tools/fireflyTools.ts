@@ -15,19 +15,17 @@ const FIREFLY_API_URL = process.env.FIREFLY_API_URL || "";
 const FIREFLY_API_TOKEN = process.env.FIREFLY_API_TOKEN || "";
 const BASE = FIREFLY_API_URL ? `${FIREFLY_API_URL.replace(/\/+$/, "")}/api/v1` : "";
 
-function authHeaders(): Record<string, string> {
-  return {
-    Authorization: `Bearer ${FIREFLY_API_TOKEN}`,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  Authorization: `Bearer ${FIREFLY_API_TOKEN}`,
+  "Content-Type": "application/json",
+};
 
 async function fireflyFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   if (!BASE) throw new Error("FIREFLY_API_URL not set in environment.");
   const url = `${BASE}${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
@@ -40,9 +38,8 @@ async function fireflyFetch(method: string, path: string, body?: unknown): Promi
 }
 
 export function registerFireflyTools(server: McpServer): void {
-  const noKey = () => {
-    return { content: [{ type: "text" as const, text: "FIREFLY_API_TOKEN not set in environment." }] };
-  };
+  const noKeyResult = { content: [{ type: "text" as const, text: "FIREFLY_API_TOKEN not set in environment." }] };
+  const noKey = () => noKeyResult;
 
   // --- List accounts ---
   server.registerTool(
@@ -13,18 +13,16 @@ import { z } from "zod";
 
 const GELATO_KEY = process.env.GELATO_API_KEY || "";
 
-function authHeaders(): Record<string, string> {
-  return {
-    "X-API-KEY": GELATO_KEY,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  "X-API-KEY": GELATO_KEY,
+  "Content-Type": "application/json",
+};
 
 async function gelatoFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `https://api.gelato.com/v2${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
@@ -37,9 +35,8 @@ async function gelatoFetch(method: string, path: string, body?: unknown): Promis
 }
 
 export function registerGelatoTools(server: McpServer): void {
-  const noKey = () => {
-    return { content: [{ type: "text" as const, text: "GELATO_API_KEY not set in environment." }] };
-  };
+  const noKeyResult = { content: [{ type: "text" as const, text: "GELATO_API_KEY not set in environment." }] };
+  const noKey = () => noKeyResult;
 
   // --- List products ---
   server.registerTool(
@@ -166,7 +163,7 @@ export function registerGelatoTools(server: McpServer): void {
     },
     async ({ product_id, country, quantity = 1 }) => {
       if (!GELATO_KEY) return noKey();
-      const data = await gelatoFetch("GET", `/products/${product_id}/shipping?country=${country}&quantity=${quantity}`);
+      const data = await gelatoFetch("GET", `/products/${product_id}/shipping?country=${encodeURIComponent(country)}&quantity=${quantity}`);
       return { content: [{ type: "text" as const, text: JSON.stringify(data, null, 2) }] };
     },
   );
@@ -11,11 +11,161 @@
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
-import { exec } from "child_process";
+import { exec, execFile } from "child_process";
 import { promisify } from "util";
 import { validatePath } from "../utils/security.js";
+import { mapSettled } from "../utils/concurrency.js";
 
 const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
+
+// Arguments containing quoting, globbing, tilde expansion or redirection
+// (or %VAR% references under cmd.exe) still need a shell; everything else is
+// split on whitespace and passed to git directly.
+const SHELL_SYNTAX =
+	process.platform === "win32" ? /[|&;<>*?`$()'"\\\n~[\]%]/ : /[|&;<>*?`$()'"\\\n~[\]]/;
+
+/**
+ * Run git with the given argument string, skipping the shell when possible
+ */
+function runGit(
+	gitArgs: string,
+	options: { timeout: number; cwd: string; maxBuffer: number; env?: NodeJS.ProcessEnv }
+) {
+	if (SHELL_SYNTAX.test(gitArgs)) {
+		return execAsync(`git ${gitArgs}`, options);
+	}
+	const argv = gitArgs.trim().split(/\s+/).filter(Boolean);
+	return execFileAsync("git", argv, options);
+}
+
+/**
+ * Result of a single git invocation
+ */
+type GitResult = {
+	output: string;
+	exitCode: number;
+	success: boolean;
+};
+
+/**
+ * Maximum number of git processes git_batch runs at once
+ */
+const MAX_PARALLEL_GIT = 4;
+
+/**
+ * Subcommands git_batch may run. None of them write to the repository;
+ * batches also run with GIT_OPTIONAL_LOCKS=0 so status doesn't take
+ * index.lock to refresh the index while another command is running.
+ */
+const READ_ONLY_GIT_COMMANDS = new Set([
+	"blame",
+	"cat-file",
+	"describe",
+	"diff",
+	"grep",
+	"log",
+	"ls-files",
+	"ls-tree",
+	"rev-list",
+	"rev-parse",
+	"shortlog",
+	"show",
+	"status",
+]);
+
+// Command chaining or redirection would let a batched command write despite
+// the read-only subcommand
+const BATCH_FORBIDDEN_SYNTAX = /[|&;<>`$\n]/;
+
+/**
+ * Long options that write files, run external programs or read outside the
+ * repository. git accepts unambiguous prefixes, so any prefix is rejected too.
+ */
+const BATCH_FORBIDDEN_OPTIONS = [
+	"--ext-diff",
+	"--filters",
+	"--no-index",
+	"--open-files-in-pager",
+	"--output",
+	"--textconv",
+];
+
+/**
+ * Whether a single git_batch argument is one of the forbidden options
+ */
+function isForbiddenBatchArg(arg: string): boolean {
+	// Quotes are removed by the shell before git sees the option
+	const token = arg.replace(/['"\\]/g, "");
+	// -O<pager> (grep --open-files-in-pager), also inside bundled short flags
+	if (/^-[^-]/.test(token)) return token.includes("O");
+	if (!token.startsWith("--") || token === "--") return false;
+	const name = token.split("=")[0]!;
+	return BATCH_FORBIDDEN_OPTIONS.some((option) => option.startsWith(name));
+}
+
+/**
+ * Check that a git_batch command is a read-only subcommand
+ *
+ * @returns Error text for the caller, or undefined when the command is allowed
+ */
+function checkReadOnlyGit(gitArgs: string): string | undefined {
+	const [subcommand = "", ...args] = gitArgs.trim().split(/\s+/);
+	if (
+		READ_ONLY_GIT_COMMANDS.has(subcommand) &&
+		!BATCH_FORBIDDEN_SYNTAX.test(gitArgs) &&
+		!args.some(isForbiddenBatchArg)
+	) {
+		return undefined;
+	}
+	return `🔒 Security Error: git_batch only runs read-only commands (${[
+		...READ_ONLY_GIT_COMMANDS,
+	].join(", ")}) without ${BATCH_FORBIDDEN_OPTIONS.join(", ")} or -O; rejected 'git ${gitArgs}'`;
+}
+
+/**
+ * Validate an optional git working directory
+ *
+ * @returns Error text for the caller, or undefined when the directory is allowed
+ */
+function checkGitCwd(cwd: string | undefined): string | undefined {
+	if (!cwd) return undefined;
+	const validation = validatePath(cwd, "read");
+	if (validation.valid) return undefined;
+	return `🔒 Security Error: Invalid git directory '${cwd}' - ${validation.checks.join(
+		"; "
+	)}`;
+}
+
+/**
+ * Execute a git command and normalize success and failure into a GitResult
+ */
+async function executeGit(
+	gitArgs: string,
+	cwd: string | undefined,
+	timeout: number,
+	env?: NodeJS.ProcessEnv
+): Promise<GitResult> {
+	try {
+		const { stdout, stderr } = await runGit(gitArgs, {
+			timeout,
+			cwd: cwd || process.cwd(),
+			maxBuffer: 1024 * 1024, // 1MB buffer
+			...(env ? { env } : {}),
+		});
+		return {
+			output: stdout.toString().trim() || stderr.toString().trim(),
+			exitCode: 0,
+			success: true,
+		};
+	} catch (error: any) {
+		return {
+			output: error.stderr?.toString().trim() || error.message,
+			exitCode: error.code || 1,
+			success: false,
+		};
+	}
+}
 
 /**
  * Register git tools with the MCP server
@@ -55,57 +205,18 @@ export function registerGitTools(server: McpServer) {
 			},
 		},
 		async ({ git_args, cwd, timeout = 60000 }) => {
-			try {
-				// Validate directory if provided
-				if (cwd) {
-					const validation = validatePath(cwd, "read");
-					if (!validation.valid) {
-						return {
-							content: [
-								{
-									type: "text",
-									text: `🔒 Security Error: Invalid git directory '${cwd}' - ${validation.checks.join(
-										"; "
-									)}`,
-								},
-							],
-							isError: true,
-						};
-					}
-				}
-
-				// Construct git command
-				const gitCommand = `git ${git_args}`;
-
-				// Execute git command
-				const { stdout, stderr } = await execAsync(gitCommand, {
-					timeout,
-					cwd: cwd || process.cwd(),
-					maxBuffer: 1024 * 1024, // 1MB buffer
-				});
-
-				const output = {
-					output: stdout.toString().trim() || stderr.toString().trim(),
-					exitCode: 0,
-					success: true,
-				};
-
+			// Validate directory if provided
+			const cwdError = checkGitCwd(cwd);
+			if (cwdError) {
 				return {
-					content: [
-						{
-							type: "text",
-							text: `✅ Git command executed successfully (🔒 SECURITY VALIDATED)\n\n${output.output}`,
-						},
-					],
-					structuredContent: output,
-				};
-			} catch (error: any) {
-				const output = {
-					output: error.stderr?.toString().trim() || error.message,
-					exitCode: error.code || 1,
-					success: false,
+					content: [{ type: "text", text: cwdError }],
+					isError: true,
 				};
+			}
 
+			const output = await executeGit(git_args, cwd, timeout);
+
+			if (!output.success) {
 				return {
 					content: [
 						{
@@ -117,6 +228,100 @@ export function registerGitTools(server: McpServer) {
 					isError: true,
 				};
 			}
+
+			return {
+				content: [
+					{
+						type: "text",
+						text: `✅ Git command executed successfully (🔒 SECURITY VALIDATED)\n\n${output.output}`,
+					},
+				],
+				structuredContent: output,
+			};
+		}
+	);
+
+	// GIT BATCH TOOL
+	server.registerTool(
+		"git_batch",
+		{
+			title: "Git Batch",
+			description:
+				"Run several independent, read-only git commands (status, log, diff, show, rev-parse, ...) in one call. Commands run concurrently and results are returned in input order. Mutating commands are rejected; use git_command for those. Each directory is validated like git_command.",
+			inputSchema: {
+				commands: z
+					.array(
+						z.object({
+							git_args: z
+								.string()
+								.describe("Git command arguments (e.g., 'status', 'log --oneline -5')"),
+							cwd: z
+								.string()
+								.optional()
+								.describe("Repository directory (default: current directory)"),
+						})
+					)
+					.min(1)
+					.max(20)
+					.describe("Git commands to run (1-20)"),
+				timeout: z
+					.number()
+					.optional()
+					.default(60000)
+					.describe("Timeout per command in milliseconds (default: 60000)"),
+			},
+			outputSchema: {
+				results: z.array(
+					z.object({
+						git_args: z.string(),
+						output: z.string(),
+						exitCode: z.number(),
+						success: z.boolean(),
+					})
+				),
+			},
+		},
+		async ({ commands, timeout = 60000 }) => {
+			// Reject the whole batch if any command or directory fails validation
+			for (const command of commands) {
+				const commandError =
+					checkReadOnlyGit(command.git_args) ?? checkGitCwd(command.cwd);
+				if (commandError) {
+					return {
+						content: [{ type: "text", text: commandError }],
+						isError: true,
+					};
+				}
+			}
+
+			// Bounded pool so a large batch can't spawn unbounded processes
+			const env = { ...process.env, GIT_OPTIONAL_LOCKS: "0" };
+			const outcomes = await mapSettled(commands, MAX_PARALLEL_GIT, (command) =>
+				executeGit(command.git_args, command.cwd, timeout, env)
+			);
+			const results: Array<GitResult & { git_args: string }> = outcomes.map((outcome, i) => ({
+				git_args: commands[i]!.git_args,
+				...(outcome.status === "fulfilled"
+					? outcome.value
+					: { output: String(outcome.reason), exitCode: 1, success: false }),
+			}));
+
+			const failed = results.filter((r) => !r.success).length;
+			const sections = results.map(
+				(r) =>
+					`${r.success ? "✅" : `❌ (exit code ${r.exitCode})`} git ${r.git_args}\n${r.output}`
+			);
+
+			return {
+				content: [
+					{
+						type: "text",
+						text: `${failed === 0 ? "✅" : "⚠️"} Ran ${results.length} git command(s), ${failed} failed\n\n${sections.join("\n\n")}`,
+					},
+				],
+				structuredContent: { results },
+				...(failed === results.length ? { isError: true } : {}),
+			};
 		}
 	);
 }
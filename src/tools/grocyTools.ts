@@ -15,19 +15,17 @@ const GROCY_URL = process.env.GROCY_BASE_URL || "";
 const GROCY_KEY = process.env.GROCY_API_KEY || "";
 const GROCY_BASE = (GROCY_URL ? GROCY_URL.replace(/\/$/, "") : GROCY_URL) + "/api";
 
-function authHeaders(): Record<string, string> {
-  return {
-    "GROCY-API-KEY": GROCY_KEY,
-    "Content-Type": "application/json",
-    "Accept": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  "GROCY-API-KEY": GROCY_KEY,
+  "Content-Type": "application/json",
+  "Accept": "application/json",
+};
 
 async function grocyFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `${GROCY_BASE}${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
@@ -40,9 +38,8 @@ async function grocyFetch(method: string, path: string, body?: unknown): Promise
 }
 
 export function registerGrocyTools(server: McpServer): void {
-  const noKey = () => {
-    return { content: [{ type: "text" as const, text: "GROCY_BASE_URL or GROCY_API_KEY not set in environment." }] };
-  };
+  const noKeyResult = { content: [{ type: "text" as const, text: "GROCY_BASE_URL or GROCY_API_KEY not set in environment." }] };
+  const noKey = () => noKeyResult;
 
   // --- List products ---
   server.registerTool(
@@ -5,6 +5,7 @@ import path from "path";
 import fs from "fs/promises";
 import { existsSync } from "fs";
 import type { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
+import { mapSettled } from "../utils/concurrency.js";
 
 /**
  * Image Generation & Manipulation Tools
@@ -27,6 +28,16 @@ interface ResizeOptions {
 // Image Generation Tool
 // =============================================================================
 
+// Reuse one Hugging Face client per token rather than building one per request
+let hfClient: { token: string; client: InferenceClient } | undefined;
+
+function getInferenceClient(token: string): InferenceClient {
+	if (hfClient?.token !== token) {
+		hfClient = { token, client: new InferenceClient(token) };
+	}
+	return hfClient.client;
+}
+
 export const imageGenerateTool = {
 	name: "image_generate",
 	description: `Generate images from text prompts using AI models. 
@@ -100,8 +111,8 @@ export const imageGenerateTool = {
 			await fs.mkdir(outputDir, { recursive: true });
 		}
 
-		// Initialize Hugging Face Inference Client
-		const client = new InferenceClient(HF_TOKEN) as InferenceClient;
+		// Hugging Face Inference Client (shared across calls)
+		const client = getInferenceClient(HF_TOKEN);
 
 		try {
 			// Determine which model to use
@@ -272,6 +283,7 @@ export const imageConvertTool = {
 
 		const results: string[] = [];
 		const errors: string[] = [];
+		let totalBytes = 0;
 
 		// Single file conversion
 		if (!isDirectory) {
@@ -281,7 +293,7 @@ export const imageConvertTool = {
 					`${path.parse(args.input).name}.${args.output_format}`
 				);
 
-				await convertSingleImage(
+				totalBytes += await convertSingleImage(
 					args.input,
 					outputPath,
 					args.output_format,
@@ -296,45 +308,52 @@ export const imageConvertTool = {
 			// Batch conversion
 			const files = await findImageFiles(args.input);
 
-			for (const file of files) {
-				try {
-					const relativePath = path.relative(args.input, file);
-					const outputPath = args.preserve_structure
+			// Without preserve_structure, same-named files from different
+			// subdirectories map to one output and must not be written together
+			const jobs = planBatchOutputs(
+				files,
+				(file) =>
+					args.preserve_structure
 						? path.join(
 								outputDir,
-								path.dirname(relativePath),
+								path.dirname(path.relative(args.input, file)),
 								`${path.parse(file).name}.${args.output_format}`
 						  )
 						: path.join(
 								outputDir,
 								`${path.parse(file).name}.${args.output_format}`
-						  );
-
-					// Create subdirectories if preserving structure
-					if (args.preserve_structure) {
-						const outputSubdir = path.dirname(outputPath);
-						if (!existsSync(outputSubdir)) {
-							await fs.mkdir(outputSubdir, { recursive: true });
-						}
-					}
+						  ),
+				errors
+			);
 
-					await convertSingleImage(
-						file,
-						outputPath,
-						args.output_format,
-						args.quality || 80
-					);
-					results.push(outputPath);
-				} catch (error: unknown) {
-					const err = error as Error;
-					errors.push(`${file}: ${err.message}`);
+			const outcomes = await mapSettled(jobs, MAX_PARALLEL_IMAGES, async ({ file, outputPath }) => {
+				// Create subdirectories if preserving structure
+				if (args.preserve_structure) {
+					await fs.mkdir(path.dirname(outputPath), { recursive: true });
 				}
-			}
+
+				const bytes = await convertSingleImage(
+					file,
+					outputPath,
+					args.output_format,
+					args.quality || 80
+				);
+				return { outputPath, bytes };
+			});
+
+			outcomes.forEach((outcome, i) => {
+				if (outcome.status === "fulfilled") {
+					totalBytes += outcome.value.bytes;
+					results.push(outcome.value.outputPath);
+				} else {
+					errors.push(`${jobs[i]!.file}: ${(outcome.reason as Error).message}`);
+				}
+			});
 		}
 
 		const successCount = results.length;
 		const errorCount = errors.length;
-		const totalSize = await calculateTotalSize(results);
+		const totalSize = totalBytes / (1024 * 1024);
 
 		return {
 			content: [
@@ -492,42 +511,44 @@ export const imageResizeTool = {
 
 		const files = isDirectory ? await findImageFiles(args.input) : [args.input];
 
-		for (const file of files) {
-			try {
-				const outputPath = path.join(
-					outputDir,
-					`${path.parse(file).name}-resized${path.extname(file)}`
-				);
-
-				const image = sharp(file) as sharp.Sharp;
+		const jobs = planBatchOutputs(
+			files,
+			(file) =>
+				path.join(outputDir, `${path.parse(file).name}-resized${path.extname(file)}`),
+			errors
+		);
 
-				// Apply resize
-				const resizeOptions: ResizeOptions = {
-					fit: (args.fit || "cover") as
-						| "cover"
-						| "contain"
-						| "fill"
-						| "inside"
-						| "outside",
-				};
-				if (targetWidth) resizeOptions.width = targetWidth;
-				if (targetHeight) resizeOptions.height = targetHeight;
+		const outcomes = await mapSettled(jobs, MAX_PARALLEL_IMAGES, async ({ file, outputPath }) => {
+			const image = sharp(file) as sharp.Sharp;
+
+			// Apply resize
+			const resizeOptions: ResizeOptions = {
+				fit: (args.fit || "cover") as
+					| "cover"
+					| "contain"
+					| "fill"
+					| "inside"
+					| "outside",
+			};
+			if (targetWidth) resizeOptions.width = targetWidth;
+			if (targetHeight) resizeOptions.height = targetHeight;
+
+			// If only one dimension is set and maintain aspect ratio, let Sharp auto-calculate
+			if (
+				args.maintain_aspect_ratio &&
+				((targetWidth && !targetHeight) || (!targetWidth && targetHeight))
+			) {
+				resizeOptions.fit = "inside";
+			}
 
-				// If only one dimension is set and maintain aspect ratio, let Sharp auto-calculate
-				if (
-					args.maintain_aspect_ratio &&
-					((targetWidth && !targetHeight) || (!targetWidth && targetHeight))
-				) {
-					resizeOptions.fit = "inside";
-				}
+			await image.resize(resizeOptions).toFile(outputPath);
+			return outputPath;
+		});
 
-				await image.resize(resizeOptions).toFile(outputPath);
-				results.push(outputPath);
-			} catch (error: unknown) {
-				const err = error as Error;
-				errors.push(`${file}: ${err.message}`);
-			}
-		}
+		outcomes.forEach((outcome, i) => {
+			if (outcome.status === "fulfilled") results.push(outcome.value);
+			else errors.push(`${jobs[i]!.file}: ${(outcome.reason as Error).message}`);
+		});
 
 		return {
 			content: [
@@ -638,80 +659,48 @@ export const imageOptimizeTool = {
 
 		const files = isDirectory ? await findImageFiles(args.input) : [args.input];
 
-		for (const file of files) {
-			try {
-				const originalStats = await fs.stat(file);
-				const originalSize = originalStats.size;
+		const jobs = planBatchOutputs(
+			files,
+			(file) => path.join(outputDir, path.basename(file)),
+			errors
+		);
 
-				const outputPath = path.join(outputDir, path.basename(file));
-				const ext = path.extname(file).toLowerCase();
+		const outcomes = await mapSettled(jobs, MAX_PARALLEL_IMAGES, async ({ file, outputPath }) => {
+			const originalStats = await fs.stat(file);
+			const originalSize = originalStats.size;
 
-				const sharpImage = sharp(file);
-				let processedImage: Buffer;
+			const ext = path.extname(file).toLowerCase();
 
-				if (ext === ".jpg" || ext === ".jpeg") {
-					let image = sharpImage;
-					if (args.preserve_metadata) {
-						image = image.withMetadata();
-					}
-					processedImage = await image
-						.jpeg({
-							quality: args.quality || 80,
-							mozjpeg: true,
-							progressive: true,
-						})
-						.toBuffer();
-				} else if (ext === ".png") {
-					let image = sharpImage;
-					if (args.preserve_metadata) {
-						image = image.withMetadata();
-					}
-					processedImage = await image
-						.png({
-							compressionLevel: 9,
-							quality: args.quality || 80,
-							palette: true,
-						})
-						.toBuffer();
-				} else if (ext === ".webp") {
-					let image = sharpImage;
-					if (args.preserve_metadata) {
-						image = image.withMetadata();
-					}
-					processedImage = await image
-						.webp({ quality: args.quality || 80, effort: 6 })
-						.toBuffer();
-				} else if (ext === ".avif") {
-					let image = sharpImage;
-					if (args.preserve_metadata) {
-						image = image.withMetadata();
-					}
-					processedImage = await image
-						.avif({ quality: args.quality || 50, effort: 4 })
-						.toBuffer();
-				} else {
-					// Default optimization
-					processedImage = await sharpImage.toBuffer();
-				}
+			// Unknown extensions are re-encoded by sharp with its defaults
+			const optimize = OPTIMIZE_ENCODERS.get(ext);
+			let image = sharp(file);
+			if (optimize && args.preserve_metadata) {
+				image = image.withMetadata();
+			}
+			const processedImage = await (optimize
+				? optimize(image, args.quality)
+				: image
+			).toBuffer();
 
-				// Write the processed image
-				await fs.writeFile(outputPath, processedImage);
+			// Write the processed image
+			await fs.writeFile(outputPath, processedImage);
 
-				const optimizedStats = await fs.stat(outputPath);
-				const optimizedSize = optimizedStats.size;
-				const savings = ((originalSize - optimizedSize) / originalSize) * 100;
+			const optimizedStats = await fs.stat(outputPath);
+			const optimizedSize = optimizedStats.size;
+			const savings = ((originalSize - optimizedSize) / originalSize) * 100;
 
-				results.push({
-					file: path.basename(file),
-					originalSize,
-					optimizedSize,
-					savings,
-				});
-			} catch (error: unknown) {
-				const err = error as Error;
-				errors.push(`${file}: ${err.message}`);
-			}
-		}
+			return {
+				file: path.basename(file),
+				originalSize,
+				optimizedSize,
+				savings,
+			};
+		});
+
+		outcomes.forEach((outcome, i) => {
+			if (outcome.status === "fulfilled") results.push(outcome.value);
+			else errors.push(`${jobs[i]!.file}: ${(outcome.reason as Error).message}`);
+		});
 
 		const totalOriginalSize = results.reduce(
 			(sum, r) => sum + r.originalSize,
@@ -1289,6 +1278,88 @@ ${
 // Helper Functions
 // =============================================================================
 
+/**
+ * Maximum number of images the batch tools process at once. sharp works on
+ * libuv's thread pool, so independent images can be encoded side by side.
+ */
+const MAX_PARALLEL_IMAGES = 4;
+
+// Case-insensitive filesystems treat a.png and A.png as the same output file
+const CASE_INSENSITIVE_FS = process.platform === "win32" || process.platform === "darwin";
+
+/**
+ * Pair each batch input with its output path. Only the first input for a
+ * given output path is kept; later ones are reported in `errors` instead of
+ * being written concurrently over the same file.
+ */
+function planBatchOutputs(
+	files: string[],
+	outputPathFor: (file: string) => string,
+	errors: string[]
+): Array<{ file: string; outputPath: string }> {
+	const claimed = new Map<string, string>();
+	const jobs: Array<{ file: string; outputPath: string }> = [];
+	for (const file of files) {
+		const outputPath = outputPathFor(file);
+		const resolved = path.resolve(outputPath);
+		const key = CASE_INSENSITIVE_FS ? resolved.toLowerCase() : resolved;
+		const owner = claimed.get(key);
+		if (owner !== undefined) {
+			errors.push(`${file}: output ${outputPath} already written from ${owner}`);
+			continue;
+		}
+		claimed.set(key, file);
+		jobs.push({ file, outputPath });
+	}
+	return jobs;
+}
+
+/**
+ * Output encoder settings per format, looked up by convertSingleImage
+ */
+const FORMAT_ENCODERS = new Map<
+	string,
+	(image: sharp.Sharp, quality: number) => sharp.Sharp
+>([
+	["webp", (image, quality) => image.webp({ quality, effort: 6 })],
+	["png", (image, quality) => image.png({ compressionLevel: 9, quality })],
+	["jpeg", (image, quality) => image.jpeg({ quality, mozjpeg: true })],
+	["jpg", (image, quality) => image.jpeg({ quality, mozjpeg: true })],
+	[
+		"avif",
+		(image, quality) =>
+			image.avif({ quality: Math.max(50, quality - 30), effort: 4 }),
+	],
+	["gif", (image) => image.gif()],
+	["tiff", (image, quality) => image.tiff({ compression: "jpeg", quality })],
+]);
+
+/**
+ * Optimisation encoder settings per file extension, looked up by image_optimize
+ */
+const OPTIMIZE_ENCODERS = new Map<
+	string,
+	(image: sharp.Sharp, quality: number | undefined) => sharp.Sharp
+>([
+	[
+		".jpg",
+		(image, quality) =>
+			image.jpeg({ quality: quality || 80, mozjpeg: true, progressive: true }),
+	],
+	[
+		".jpeg",
+		(image, quality) =>
+			image.jpeg({ quality: quality || 80, mozjpeg: true, progressive: true }),
+	],
+	[
+		".png",
+		(image, quality) =>
+			image.png({ compressionLevel: 9, quality: quality || 80, palette: true }),
+	],
+	[".webp", (image, quality) => image.webp({ quality: quality || 80, effort: 6 })],
+	[".avif", (image, quality) => image.avif({ quality: quality || 50, effort: 4 })],
+]);
+
 /**
  * Convert a single image to a different format
  */
@@ -1297,36 +1368,31 @@ async function convertSingleImage(
 	outputPath: string,
 	format: string,
 	quality: number
-): Promise<void> {
-	const image = sharp(inputPath);
-
-	switch (format.toLowerCase()) {
-		case "webp":
-			await image.webp({ quality, effort: 6 }).toFile(outputPath);
-			break;
-		case "png":
-			await image.png({ compressionLevel: 9, quality }).toFile(outputPath);
-			break;
-		case "jpeg":
-		case "jpg":
-			await image.jpeg({ quality, mozjpeg: true }).toFile(outputPath);
-			break;
-		case "avif":
-			await image
-				.avif({ quality: Math.max(50, quality - 30), effort: 4 })
-				.toFile(outputPath);
-			break;
-		case "gif":
-			await image.gif().toFile(outputPath);
-			break;
-		case "tiff":
-			await image.tiff({ compression: "jpeg", quality }).toFile(outputPath);
-			break;
-		default:
-			throw new Error(`Unsupported format: ${format}`);
+): Promise<number> {
+	const encode = FORMAT_ENCODERS.get(format.toLowerCase());
+	if (!encode) {
+		throw new Error(`Unsupported format: ${format}`);
 	}
+
+	// sharp reports the written size, so callers don't need to stat the output
+	const info = await encode(sharp(inputPath), quality).toFile(outputPath);
+	return info.size;
 }
 
+/**
+ * File extensions findImageFiles treats as images
+ */
+const IMAGE_EXTENSIONS = new Set([
+	".jpg",
+	".jpeg",
+	".png",
+	".gif",
+	".webp",
+	".tiff",
+	".bmp",
+	".avif",
+]);
+
 /**
  * Recursively find all image files in a directory
  */
@@ -1337,16 +1403,6 @@ async function findImageFiles(
 		excludeDirNamePrefixes?: string[] | undefined;
 	}
 ): Promise<string[]> {
-	const imageExtensions = [
-		".jpg",
-		".jpeg",
-		".png",
-		".gif",
-		".webp",
-		".tiff",
-		".bmp",
-		".avif",
-	];
 	const files: string[] = [];
 	const excludedRoots = (options?.excludeDirs ?? []).map((d) =>
 		path.resolve(d)
@@ -1389,7 +1445,7 @@ async function findImageFiles(
 				}
 
 				const ext = path.extname(entry.name).toLowerCase();
-				if (imageExtensions.includes(ext)) {
+				if (IMAGE_EXTENSIONS.has(ext)) {
 					files.push(fullPath);
 				}
 			}
@@ -1400,22 +1456,6 @@ async function findImageFiles(
 	return files;
 }
 
-/**
- * Calculate total size of files in MB
- */
-async function calculateTotalSize(files: string[]): Promise<number> {
-	let totalSize = 0;
-	for (const file of files) {
-		try {
-			const stats = await fs.stat(file);
-			totalSize += stats.size;
-		} catch {
-			// Skip files that can't be accessed
-		}
-	}
-	return totalSize / (1024 * 1024);
-}
-
 /** Per-channel mean and stdev summary used by color profile and correction */
 interface ChannelStats {
 	r: { mean: number; stdev: number };
@@ -15,18 +15,16 @@ const KITCHENOWL_API_URL = process.env.KITCHENOWL_API_URL || "";
 const KITCHENOWL_API_TOKEN = process.env.KITCHENOWL_API_TOKEN || "";
 const BASE = KITCHENOWL_API_URL ? `${KITCHENOWL_API_URL.replace(/\/$/, "")}/api` : "";
 
-function authHeaders(): Record<string, string> {
-  return {
-    Authorization: `Bearer ${KITCHENOWL_API_TOKEN}`,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  Authorization: `Bearer ${KITCHENOWL_API_TOKEN}`,
+  "Content-Type": "application/json",
+};
 
 async function kitchenOwlFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `${BASE}${path.startsWith("/") ? path : `/${path}`}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
@@ -39,9 +37,8 @@ async function kitchenOwlFetch(method: string, path: string, body?: unknown): Pr
 }
 
 export function registerKitchenOwlTools(server: McpServer): void {
-  const noKey = () => {
-    return { content: [{ type: "text" as const, text: "KITCHENOWL_API_URL or KITCHENOWL_API_TOKEN not set in environment." }] };
-  };
+  const noKeyResult = { content: [{ type: "text" as const, text: "KITCHENOWL_API_URL or KITCHENOWL_API_TOKEN not set in environment." }] };
+  const noKey = () => noKeyResult;
 
   // --- Get current meal plan ---
   server.registerTool(
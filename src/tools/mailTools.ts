@@ -10,7 +10,8 @@
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
-import { existsSync, openSync, readSync, closeSync, fstatSync } from "fs";
+import { existsSync } from "fs";
+import { open, type FileHandle } from "fs/promises";
 import { simpleParser } from "mailparser";
 
 // Path resolution
@@ -42,8 +43,14 @@ interface CacheEntry {
 let recentCache: CacheEntry | null = null;
 const CACHE_TTL_MS = 60_000; // 1 minute TTL
 
+const NO_MBOX_RESULT = { content: [{ type: "text" as const, text: `Mailbox not found at ${MBOX_PATH}. Set MAIL_MBOX_PATH env var.` }] };
+
 function noMbox() {
-  return { content: [{ type: "text" as const, text: `Mailbox not found at ${MBOX_PATH}. Set MAIL_MBOX_PATH env var.` }] };
+  return NO_MBOX_RESULT;
+}
+
+function escapeRegExp(value: string): string {
+  return value.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
 }
 
 /**
@@ -56,77 +63,72 @@ async function readMboxTail(maxBytes: number, maxMessages: number = 200): Promis
     return [];
   }
 
-  let fd: number;
+  // Async handle so large tail reads don't block the event loop
+  let handle: FileHandle;
   try {
-    fd = openSync(MBOX_PATH, "r");
+    handle = await open(MBOX_PATH, "r");
   } catch {
     return [];
   }
 
+  let fileSize: number;
+  let mtimeMs: number;
+  let chunk: string;
   try {
-    const stat = fstatSync(fd);
-    const fileSize = stat.size;
-    const mtimeMs = stat.mtimeMs;
+    const stat = await handle.stat();
+    fileSize = stat.size;
+    mtimeMs = stat.mtimeMs;
 
     // Check cache
     if (recentCache && recentCache.mtimeMs === mtimeMs && recentCache.size === fileSize && (Date.now() - recentCache.fetchedAt) < CACHE_TTL_MS) {
-      closeSync(fd);
       return recentCache.messages.slice(0, maxMessages);
     }
 
-      const readStart = Math.max(0, fileSize - Math.min(maxBytes, MAX_READ_BYTES));
-      const bytesToRead = fileSize - readStart;
-      const buf = Buffer.alloc(bytesToRead);
-
-      const readBytes = readSync(fd, buf, 0, bytesToRead, readStart);
-      closeSync(fd);
-
-      const chunk = buf.toString("utf-8", 0, readBytes);
-
-      // Find message boundaries — each message starts with "From " at beginning of line
-      // Split on the mbox delimiter pattern
-      const delimiter = /\nFrom [^\n]*\n/g;
-      const parts = chunk.split(delimiter);
-
-      // Reconstruct messages: each part after the first is a message body
-      const rawMessages: string[] = [];
-      for (let i = 1; i < parts.length; i++) {
-        rawMessages.push(parts[i] as string);
-      }
-
-      // Parse messages — need to exit the sync Promise executor for await
-      const parseMessages = async () => {
-        const results: ParsedMail[] = [];
-        for (let i = rawMessages.length - 1; i >= 0 && results.length < maxMessages; i--) {
-          const raw: string | undefined = rawMessages[i];
-          if (!raw) continue;
-          try {
-            const parsed = await simpleParser(raw as string);
-            results.push({
-              subject: parsed.subject || "(no subject)",
-              from: parsed.from?.text || "unknown",
-              to: parsed.to?.text || "",
-              date: parsed.date?.toISOString() || "unknown",
-              snippet: (parsed.text || parsed.html || "").toString().substring(0, 200).replace(/\s+/g, " ").trim(),
-              messageId: parsed.messageId || null,
-              text: parsed.text ? parsed.text.toString().substring(0, 5000) : null,
-            });
-          } catch {
-            // Skip unparseable
-          }
-        }
-        return results;
-      };
+    const readStart = Math.max(0, fileSize - Math.min(maxBytes, MAX_READ_BYTES));
+    const bytesToRead = fileSize - readStart;
+    const buf = Buffer.alloc(bytesToRead);
+
+    const { bytesRead } = await handle.read(buf, 0, bytesToRead, readStart);
+    chunk = buf.toString("utf-8", 0, bytesRead);
+  } finally {
+    await handle.close();
+  }
 
-      const finalMessages = await parseMessages();
+  // Find message boundaries — each message starts with "From " at beginning of line
+  // Split on the mbox delimiter pattern
+  const delimiter = /\nFrom [^\n]*\n/g;
+  const parts = chunk.split(delimiter);
 
-      // Update cache
-      recentCache = { mtimeMs, size: fileSize, messages: finalMessages, fetchedAt: Date.now() };
-      return finalMessages;
-    } catch (err) {
-      try { closeSync(fd); } catch {}
-      throw err;
+  // Reconstruct messages: each part after the first is a message body
+  const rawMessages: string[] = [];
+  for (let i = 1; i < parts.length; i++) {
+    rawMessages.push(parts[i] as string);
+  }
+
+  // Parse newest first until we have enough messages
+  const finalMessages: ParsedMail[] = [];
+  for (let i = rawMessages.length - 1; i >= 0 && finalMessages.length < maxMessages; i--) {
+    const raw: string | undefined = rawMessages[i];
+    if (!raw) continue;
+    try {
+      const parsed = await simpleParser(raw as string);
+      finalMessages.push({
+        subject: parsed.subject || "(no subject)",
+        from: parsed.from?.text || "unknown",
+        to: parsed.to?.text || "",
+        date: parsed.date?.toISOString() || "unknown",
+        snippet: (parsed.text || parsed.html || "").toString().substring(0, 200).replace(/\s+/g, " ").trim(),
+        messageId: parsed.messageId || null,
+        text: parsed.text ? parsed.text.toString().substring(0, 5000) : null,
+      });
+    } catch {
+      // Skip unparseable
     }
+  }
+
+  // Update cache
+  recentCache = { mtimeMs, size: fileSize, messages: finalMessages, fetchedAt: Date.now() };
+  return finalMessages;
 }
 
 export function _readMboxFull(_limit: number = 50): Promise<ParsedMail[]> {
@@ -151,17 +153,19 @@ export function registerMailTools(server: McpServer): void {
       if (!existsSync(MBOX_PATH)) return noMbox();
 
       const allMail = await readMboxTail(SEARCH_TAIL_BYTES, 200); // Read tail of mbox, newest first
-      const lowerQuery = query.toLowerCase();
+      // One case-insensitive pattern instead of lowercasing every field of every message
+      const queryPattern = new RegExp(escapeRegExp(query), "i");
+      const lowerSender = sender?.toLowerCase();
       const cutoff = days ? Date.now() - days * 86400000 : 0;
 
       const filtered = allMail.filter((m) => {
         if (cutoff && new Date(m.date).getTime() < cutoff) return false;
-        if (sender && !m.from.toLowerCase().includes(sender.toLowerCase())) return false;
+        if (lowerSender && !m.from.toLowerCase().includes(lowerSender)) return false;
         return (
-          m.subject.toLowerCase().includes(lowerQuery) ||
-          m.from.toLowerCase().includes(lowerQuery) ||
-          m.snippet.toLowerCase().includes(lowerQuery) ||
-          (m.text && m.text.toLowerCase().includes(lowerQuery))
+          queryPattern.test(m.subject) ||
+          queryPattern.test(m.from) ||
+          queryPattern.test(m.snippet) ||
+          (m.text !== null && queryPattern.test(m.text))
         );
       });
 
@@ -15,16 +15,17 @@ import { z } from "zod";
 const OPENPROJECT_URL = process.env.OPENPROJECT_URL || "";
 const OPENPROJECT_KEY = process.env.OPENPROJECT_API_KEY || "";
 
+const NO_KEY_RESULT = { content: [{ type: "text" as const, text: "OPENPROJECT_URL or OPENPROJECT_API_KEY not set in environment." }] };
+
 function noKey() {
-  return { content: [{ type: "text" as const, text: "OPENPROJECT_URL or OPENPROJECT_API_KEY not set in environment." }] };
+  return NO_KEY_RESULT;
 }
 
-function baseUrl(): string {
-  return OPENPROJECT_URL.replace(/\/+$/, "") + "/api/v3";
-}
+// API root, trimmed and joined once rather than on every request
+const API_BASE = OPENPROJECT_URL.replace(/\/+$/, "") + "/api/v3";
 
 async function openProjectFetch(method: string, path: string, params?: Record<string, string | number>): Promise<unknown> {
-  const url = new URL(baseUrl() + path);
+  const url = new URL(API_BASE + path);
   if (params) {
     Object.entries(params).forEach(([k, v]) => url.searchParams.set(k, String(v)));
   }
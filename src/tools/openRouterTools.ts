@@ -13,22 +13,22 @@ import { z } from "zod";
 const API_BASE = "https://openrouter.ai/api/v1";
 const MGMT_KEY = process.env.OPENROUTER_MANAGEMENT_KEY || "";
 
+const NO_KEY_RESULT = { content: [{ type: "text" as const, text: "OPENROUTER_MANAGEMENT_KEY not set in environment." }] };
+
 function noKey() {
-  return { content: [{ type: "text" as const, text: "OPENROUTER_MANAGEMENT_KEY not set in environment." }] };
+  return NO_KEY_RESULT;
 }
 
-function authHeaders(): Record<string, string> {
-  return {
-    Authorization: `Bearer ${MGMT_KEY}`,
-    "Content-Type": "application/json",
-  };
-}
+const AUTH_HEADERS: Record<string, string> = {
+  Authorization: `Bearer ${MGMT_KEY}`,
+  "Content-Type": "application/json",
+};
 
 async function openRouterFetch(method: string, path: string, body?: unknown): Promise<unknown> {
   const url = `${API_BASE}${path}`;
   const res = await fetch(url, {
     method,
-    headers: authHeaders(),
+    headers: AUTH_HEADERS,
     ...(body !== undefined ? { body: JSON.stringify(body) } : {}),
   });
   const text = await res.text();
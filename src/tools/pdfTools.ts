@@ -103,14 +103,17 @@ const IGNORED_PREFIXES = [
 	"Invoice/Order Number:",
 ];
 
+// "05 Mar 2024" and "05 March 2024"
+const DAY_MONTH_YEAR_FORMATS = [
+	/^(\d{2}) ([A-Za-z]{3}) (\d{4})$/,
+	/^(\d{2}) ([A-Za-z]{4,9}) (\d{4})$/,
+];
+
 function parseDateString(input: string | null | undefined): string {
 	if (!input) return "";
 	const trimmed = input.trim();
-	for (const fmt of [
-		{ regex: /^(\d{2}) ([A-Za-z]{3}) (\d{4})$/ },
-		{ regex: /^(\d{2}) ([A-Za-z]{4,9}) (\d{4})$/ },
-	]) {
-		const match = trimmed.match(fmt.regex);
+	for (const regex of DAY_MONTH_YEAR_FORMATS) {
+		const match = trimmed.match(regex);
 		if (!match) continue;
 		const parsed = new Date(`${match[1]} ${match[2]} ${match[3]} UTC`);
 		if (!Number.isNaN(parsed.getTime())) {
@@ -229,8 +232,30 @@ function extractItems(lines: string[]): ReceiptItem[] {
 	return items;
 }
 
+// PDF readers accept the %PDF- header anywhere in the first 1024 bytes
+const PDF_HEADER_WINDOW = 1024;
+
+/**
+ * Read a PDF into memory, checking the header first so non-PDF files
+ * (images, archives, misnamed downloads) are rejected after a 1 KB read
+ * instead of being loaded and handed to the parser.
+ */
+async function readPdfBuffer(pdfPath: string): Promise<Buffer> {
+	const handle = await fs.promises.open(pdfPath, "r");
+	try {
+		const head = Buffer.alloc(PDF_HEADER_WINDOW);
+		const { bytesRead } = await handle.read(head, 0, PDF_HEADER_WINDOW, 0);
+		if (!head.subarray(0, bytesRead).includes("%PDF-")) {
+			throw new Error(`Not a PDF file (missing %PDF- header): ${path.basename(pdfPath)}`);
+		}
+		return await handle.readFile();
+	} finally {
+		await handle.close();
+	}
+}
+
 async function parseReceiptLocally(pdfPath: string): Promise<ReceiptData | null> {
-	const dataBuffer = fs.readFileSync(pdfPath);
+	const dataBuffer = await readPdfBuffer(pdfPath);
 	const parsed = await pdf(dataBuffer);
 	const text = parsed.text || "";
 	if (!text.trim()) return null;
@@ -291,7 +316,7 @@ export function registerPDFTools(server: McpServer): void {
 						isError: true,
 					};
 				}
-				const dataBuffer = fs.readFileSync(file_path);
+				const dataBuffer = await readPdfBuffer(file_path);
 				const parsed = await pdf(dataBuffer);
 				const text = parsed.text || "";
 				if (!text.trim()) {
@@ -367,14 +392,19 @@ export function registerPDFTools(server: McpServer): void {
 					};
 				}
 
-				const findPDFs = (dir: string, recurse: boolean): string[] => {
-					const files: string[] = [];
-					const entries = fs.readdirSync(dir, { withFileTypes: true });
+				// Scan with async readdir/stat so a large tree doesn't block the
+				// event loop; results are collected depth-first into one array
+				const findPDFs = async (
+					dir: string,
+					recurse: boolean,
+					files: string[] = []
+				): Promise<string[]> => {
+					const entries = await fs.promises.readdir(dir, { withFileTypes: true });
 
 					for (const entry of entries) {
 						const fullPath = path.join(dir, entry.name);
 						if (entry.isDirectory() && recurse) {
-							files.push(...findPDFs(fullPath, recurse));
+							await findPDFs(fullPath, recurse, files);
 						} else if (entry.isFile() && entry.name.toLowerCase().endsWith(".pdf")) {
 							files.push(fullPath);
 						}
@@ -383,7 +413,18 @@ export function registerPDFTools(server: McpServer): void {
 					return files;
 				};
 
-				const pdfFiles = findPDFs(directory, recursive || false);
+				const pdfFiles = await findPDFs(directory, recursive || false);
+				const fileInfo = await Promise.all(
+					pdfFiles.map(async (file) => {
+						const stats = await fs.promises.stat(file);
+						return {
+							path: file,
+							filename: path.basename(file),
+							size: stats.size,
+							modified: stats.mtime.toISOString(),
+						};
+					})
+				);
 				return {
 					content: [
 						{
@@ -392,12 +433,7 @@ export function registerPDFTools(server: McpServer): void {
 								{
 									directory,
 									total_files: pdfFiles.length,
-									files: pdfFiles.map((file) => ({
-										path: file,
-										filename: path.basename(file),
-										size: fs.statSync(file).size,
-										modified: fs.statSync(file).mtime.toISOString(),
-									})),
+									files: fileInfo,
 								},
 								null,
 								2
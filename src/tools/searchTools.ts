@@ -10,6 +10,7 @@
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { z } from "zod";
+import { Cache } from "../utils/cache.js";
 
 // ── Provider configuration ──
 
@@ -80,6 +81,8 @@ async function serperSearch(query: string, count: number): Promise<SearchResult[
 
 // ── DuckDuckGo fallback provider ──
 
+const DDG_RESULT_MARKER = '<div class="result__body"';
+
 async function ddgSearch(query: string, count: number): Promise<SearchResult[]> {
   const url = `https://html.duckduckgo.com/html/?q=${encodeURIComponent(query)}`;
   const res = await fetch(url, {
@@ -87,10 +90,14 @@ async function ddgSearch(query: string, count: number): Promise<SearchResult[]>
   });
   const html = await res.text();
 
+  // Walk result blocks in place and stop once `count` are collected, rather
+  // than splitting the whole page into an array of every block up front
   const results: SearchResult[] = [];
-  const parts = html.split('<div class="result__body"');
-  for (let i = 1; i < parts.length && results.length < count; i++) {
-    const part: string = parts[i] || "";
+  let start = html.indexOf(DDG_RESULT_MARKER);
+  while (start !== -1 && results.length < count) {
+    const end = html.indexOf(DDG_RESULT_MARKER, start + DDG_RESULT_MARKER.length);
+    const part = html.slice(start + DDG_RESULT_MARKER.length, end === -1 ? undefined : end);
+    start = end;
     const titleMatch = part.match(/<a[^>]+rel="nofollow"[^>]*>([\s\S]*?)<\/a>/i);
     const snippetMatch = part.match(/class="result__snippet"[^>]*>([\s\S]*?)<\/(?:a|span)>/i);
     const urlMatch = part.match(/href="(https?:\/\/[^"]+)"/i);
@@ -104,49 +111,86 @@ async function ddgSearch(query: string, count: number): Promise<SearchResult[]>
   return results;
 }
 
+// ── Provider table ──
+
+type ProviderName = "tavily" | "serper" | "duckduckgo";
+
+interface Provider {
+  label: string;
+  available: boolean;
+  search: (query: string, count: number) => Promise<SearchResult[]>;
+}
+
+const PROVIDERS: Record<ProviderName, Provider> = {
+  tavily: { label: "Tavily", available: Boolean(TAVILY_KEY), search: tavilySearch },
+  serper: { label: "Serper", available: Boolean(SERPER_KEY), search: serperSearch },
+  duckduckgo: { label: "DuckDuckGo", available: true, search: ddgSearch },
+};
+
+// Auto-route order: Tavily (AI-native, best for LLMs) → Serper.dev (Google data).
+// DuckDuckGo is the final fallback and is always tried last.
+const AUTO_ORDER = (["tavily", "serper"] as const).filter((name) => PROVIDERS[name].available);
+
 // ── Master search function ──
 
-async function searchAll(query: string, count: number, forcedProvider?: string): Promise<{
+interface SearchOutcome {
   results: SearchResult[];
   provider: string;
-}> {
-  // Force a specific provider if requested
-  if (forcedProvider === "tavily" && TAVILY_KEY) {
-    const results = await tavilySearch(query, count);
-    return { results, provider: "tavily" };
-  }
-  if (forcedProvider === "serper" && SERPER_KEY) {
-    const results = await serperSearch(query, count);
-    return { results, provider: "serper" };
-  }
-  if (forcedProvider === "duckduckgo") {
-    const results = await ddgSearch(query, count);
-    return { results, provider: "duckduckgo" };
+  // An earlier provider errored, so these are fallback results
+  degraded: boolean;
+}
+
+// Repeat searches within five minutes are served from memory instead of
+// spending another (rate-limited, often paid) provider call. Capped so a
+// long-running server doesn't keep every distinct query it has ever seen.
+const SEARCH_CACHE_MAX_ENTRIES = 500;
+const searchCache = new Cache<SearchOutcome>(5 * 60 * 1000, SEARCH_CACHE_MAX_ENTRIES);
+
+// Identical searches that arrive while one is still running share its result
+const inflightSearches = new Map<string, Promise<SearchOutcome>>();
+
+function searchAll(query: string, count: number, forcedProvider?: ProviderName): Promise<SearchOutcome> {
+  const cacheKey = `${forcedProvider ?? "auto"}\0${count}\0${query}`;
+  const cached = searchCache.get(cacheKey);
+  if (cached) return Promise.resolve(cached);
+
+  let pending = inflightSearches.get(cacheKey);
+  if (!pending) {
+    pending = searchProviders(query, count, forcedProvider)
+      .then((outcome) => {
+        // Empty or fallback-after-error results are not cached so a transient
+        // provider failure isn't pinned for the whole TTL
+        if (outcome.results.length > 0 && !outcome.degraded) searchCache.set(cacheKey, outcome);
+        return outcome;
+      })
+      .finally(() => inflightSearches.delete(cacheKey));
+    inflightSearches.set(cacheKey, pending);
   }
+  return pending;
+}
 
-  // Auto-route: Tavily first (AI-native, best for LLMs)
-  if (TAVILY_KEY) {
-    try {
-      const results = await tavilySearch(query, count);
-      if (results.length > 0) return { results, provider: "tavily" };
-    } catch (e) {
-      console.error("Tavily failed, falling back:", String(e));
-    }
+async function searchProviders(query: string, count: number, forcedProvider?: ProviderName): Promise<SearchOutcome> {
+  // Force a specific provider if requested
+  if (forcedProvider && PROVIDERS[forcedProvider].available) {
+    const results = await PROVIDERS[forcedProvider].search(query, count);
+    return { results, provider: forcedProvider, degraded: false };
   }
 
-  // Fall back to Serper.dev (Google data)
-  if (SERPER_KEY) {
+  let degraded = false;
+  for (const name of AUTO_ORDER) {
+    const { label, search } = PROVIDERS[name];
     try {
-      const results = await serperSearch(query, count);
-      if (results.length > 0) return { results, provider: "serper" };
+      const results = await search(query, count);
+      if (results.length > 0) return { results, provider: name, degraded };
     } catch (e) {
-      console.error("Serper failed, falling back:", String(e));
+      degraded = true;
+      console.error(`${label} failed, falling back:`, String(e));
     }
   }
 
   // Final fallback: DuckDuckGo (free, always available)
   const results = await ddgSearch(query, count);
-  return { results, provider: "duckduckgo" };
+  return { results, provider: "duckduckgo", degraded };
 }
 
 // ── Tool registration ──
@@ -13,8 +13,10 @@ import { z } from "zod";
 
 const SERPER_KEY = process.env.SERPER_API_KEY || "";
 
+const NO_KEY_RESULT = { content: [{ type: "text" as const, text: "SERPER_API_KEY not set in environment." }] };
+
 function noKey() {
-  return { content: [{ type: "text" as const, text: "SERPER_API_KEY not set in environment." }] };
+  return NO_KEY_RESULT;
 }
 
 async function serperFetch(query: string, count: number = 10): Promise<unknown> {
@@ -14,8 +14,10 @@ import { z } from "zod";
 
 const TAVILY_KEY = process.env.TAVILY_API_KEY || "";
 
+const NO_KEY_RESULT = { content: [{ type: "text" as const, text: "TAVILY_API_KEY not set in environment." }] };
+
 function noKey() {
-  return { content: [{ type: "text" as const, text: "TAVILY_API_KEY not set in environment." }] };
+  return NO_KEY_RESULT;
 }
 
 interface TavilyResult {
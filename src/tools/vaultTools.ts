@@ -19,10 +19,19 @@ const VAULT_CLIENT_SECRET = process.env.VAULT_OAUTH_CLIENT_SECRET || "";
 
 let cachedToken: string | null = null;
 let tokenExpiry = 0;
+// Concurrent callers share one in-flight token request instead of each
+// authenticating separately when the cached token has expired.
+let pendingAuth: Promise<string> | null = null;
 
-async function vaultAuth(): Promise<string> {
-  if (cachedToken && Date.now() < tokenExpiry - 60000) return cachedToken;
+function vaultAuth(): Promise<string> {
+  if (cachedToken && Date.now() < tokenExpiry - 60000) return Promise.resolve(cachedToken);
+  pendingAuth ??= requestVaultToken().finally(() => {
+    pendingAuth = null;
+  });
+  return pendingAuth;
+}
 
+async function requestVaultToken(): Promise<string> {
   const res = await fetch(`${VAULT_URL}/identity/connect/token`, {
     method: "POST",
     headers: { "Content-Type": "application/x-www-form-urlencoded" },
@@ -63,9 +72,8 @@ async function vaultFetch(method: string, path: string, body?: unknown): Promise
 }
 
 export function registerVaultTools(server: McpServer): void {
-  const noAuth = () => {
-    return { content: [{ type: "text" as const, text: "VAULT_OAUTH_CLIENT_ID or VAULT_OAUTH_CLIENT_SECRET not set in environment." }] };
-  };
+  const noAuthResult = { content: [{ type: "text" as const, text: "VAULT_OAUTH_CLIENT_ID or VAULT_OAUTH_CLIENT_SECRET not set in environment." }] };
+  const noAuth = () => noAuthResult;
   const notReady = () => (!VAULT_CLIENT_ID || !VAULT_CLIENT_SECRET);
 
   // --- Health / auth check ---
@@ -105,7 +113,7 @@ export function registerVaultTools(server: McpServer): void {
       let path = `/ciphers?limit=${limit}`;
       if (query) path += `&search=${encodeURIComponent(query)}`;
       if (type) path += `&type=${type}`;
-      if (folder_id) path += `&folderId=${folder_id}`;
+      if (folder_id) path += `&folderId=${encodeURIComponent(folder_id)}`;
       const data = await vaultFetch("GET", path);
       return { content: [{ type: "text" as const, text: JSON.stringify(data, null, 2) }] };
     },
@@ -16,18 +16,16 @@ import { z } from "zod";
 const VIKUNJA_URL = process.env.VIKUNJA_API_URL || "http://localhost:3456";
 const VIKUNJA_TOKEN = process.env.VIKUNJA_API_TOKEN || "";
 
-function authHeaders(): Record<string, string> {
-	return {
-		Authorization: `Bearer ${VIKUNJA_TOKEN}`,
-		"Content-Type": "application/json",
-	};
-}
+const AUTH_HEADERS: Record<string, string> = {
+	Authorization: `Bearer ${VIKUNJA_TOKEN}`,
+	"Content-Type": "application/json",
+};
 
 async function vkFetch(method: string, path: string, body?: unknown): Promise<unknown> {
 	const url = `${VIKUNJA_URL}/api/v1${path}`;
 	const res = await fetch(url, {
 		method,
-		headers: authHeaders(),
+		headers: AUTH_HEADERS,
 		...(body !== undefined ? { body: JSON.stringify(body) } : {}),
 	});
 	const text = await res.text();
@@ -97,8 +95,13 @@ export function registerVikunjaTaskTools(server: McpServer): void {
 			} else {
 				tasks = await vkFetch("GET", "/tasks") as typeof tasks;
 			}
-			if (!include_done) tasks = tasks.filter((t) => !t.done);
-			if (filter) tasks = tasks.filter((t) => t.title.toLowerCase().includes(filter.toLowerCase()));
+			// Apply both filters in one pass, lowercasing the needle only once
+			const needle = filter?.toLowerCase();
+			if (!include_done || needle) {
+				tasks = tasks.filter(
+					(t) => (include_done || !t.done) && (!needle || t.title.toLowerCase().includes(needle))
+				);
+			}
 
 			if (tasks.length === 0) return { content: [{ type: "text" as const, text: "No tasks found." }] };
 			const lines = tasks.map(
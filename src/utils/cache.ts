@@ -21,13 +21,16 @@ interface CacheEntry<T> {
 export class Cache<T> {
 	private cache: Map<string, CacheEntry<T>> = new Map();
 	private defaultTTL: number;
+	private maxEntries: number;
 
 	/**
 	 * Create a new cache
 	 * @param defaultTTL - Default time-to-live in milliseconds (default: 5 minutes)
+	 * @param maxEntries - Maximum entries kept; the oldest are evicted first (default: unbounded)
 	 */
-	constructor(defaultTTL: number = 5 * 60 * 1000) {
+	constructor(defaultTTL: number = 5 * 60 * 1000, maxEntries: number = Infinity) {
 		this.defaultTTL = defaultTTL;
+		this.maxEntries = maxEntries;
 	}
 
 	/**
@@ -58,7 +61,17 @@ export class Cache<T> {
 	 */
 	set(key: string, value: T, ttl?: number): void {
 		const expiresAt = Date.now() + (ttl || this.defaultTTL);
+		this.cache.delete(key);
 		this.cache.set(key, { value, expiresAt });
+
+		// Over the cap: drop expired entries first, then the oldest inserted
+		if (this.cache.size > this.maxEntries) {
+			this.cleanup();
+			for (const oldest of this.cache.keys()) {
+				if (this.cache.size <= this.maxEntries) break;
+				this.cache.delete(oldest);
+			}
+		}
 	}
 
 	/**
@@ -0,0 +1,45 @@
+/**
+ * Updated: 16/10/26
+ * By: Daniel Potter
+ *
+ * Bounded concurrency helpers for batch tools.
+ * Lets independent work (image encodes, git processes) run side by side
+ * without spawning an unbounded number of tasks at once.
+ *
+ * References:
+ * Promise.allSettled: https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Promise/allSettled
+ */
+
+/**
+ * Promise.allSettled over `items` with at most `limit` tasks in flight.
+ * Outcomes are returned in input order.
+ *
+ * @param items - Inputs to process
+ * @param limit - Maximum number of tasks running at once
+ * @param task - Async work for a single item
+ */
+export async function mapSettled<T, R>(
+	items: readonly T[],
+	limit: number,
+	task: (item: T, index: number) => Promise<R>
+): Promise<PromiseSettledResult<R>[]> {
+	const outcomes: PromiseSettledResult<R>[] = new Array(items.length);
+	let next = 0;
+	const worker = async () => {
+		while (next < items.length) {
+			const index = next++;
+			try {
+				outcomes[index] = {
+					status: "fulfilled",
+					value: await task(items[index]!, index),
+				};
+			} catch (reason: unknown) {
+				outcomes[index] = { status: "rejected", reason };
+			}
+		}
+	};
+	await Promise.all(
+		Array.from({ length: Math.max(1, Math.min(limit, items.length)) }, worker)
+	);
+	return outcomes;
+}
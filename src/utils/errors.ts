@@ -5,6 +5,20 @@
  * Structured error helper used across tools and resources.
  * Produces a consistent error payload for MCP responses and logging.
  */
+
+// Second-granularity timestamp, formatted at most once per second.
+let cachedSecond = -1;
+let cachedIso = "";
+
+function nowIso(): string {
+  const second = Math.floor(Date.now() / 1000);
+  if (second !== cachedSecond) {
+    cachedSecond = second;
+    cachedIso = new Date(second * 1000).toISOString();
+  }
+  return cachedIso;
+}
+
 export function makeStructuredError(
   err: unknown,
   error_code = "internal_error",
@@ -15,7 +29,7 @@ export function makeStructuredError(
     error_code,
     message,
     retryable,
-    timestamp: new Date().toISOString(),
+    timestamp: nowIso(),
   };
 }
 
@@ -45,6 +45,7 @@ const FORBIDDEN_DIRS = [
 	"venv",
 	".env",
 ];
+const FORBIDDEN_DIR_SET = new Set(FORBIDDEN_DIRS);
 
 /**
  * Commands allowed for execution
@@ -116,9 +117,8 @@ export function validatePath(
 		const allowedRoots = getAllowedRoots();
 
 		// Quick forbidden checks first (apply regardless of allowlist)
-		// Normalize forbidden paths to match the resolved path's format for consistent comparison
-		for (const forbidden of FORBIDDEN_PATHS) {
-			const normalizedForbidden = normalizeFsPath(forbidden);
+		// Forbidden paths are pre-normalized to match the resolved path's format
+		for (const [forbidden, normalizedForbidden] of getNormalizedForbiddenPaths()) {
 			// Check if the forbidden path is contained in the resolved path
 			if (resolvedPath.includes(normalizedForbidden)) {
 				checks.push(`Forbidden path detected: ${forbidden}`);
@@ -129,7 +129,7 @@ export function validatePath(
 		// Check for forbidden directories in path components
 		const parts = resolvedPath.split(path.sep);
 		for (const part of parts) {
-			if (FORBIDDEN_DIRS.includes(part)) {
+			if (FORBIDDEN_DIR_SET.has(part)) {
 				checks.push(`Forbidden directory in path: ${part}`);
 				return { valid: false, checks };
 			}
@@ -178,7 +178,30 @@ function normalizeFsPath(p: string): string {
 	return abs;
 }
 
+// Relative forbidden entries resolve against cwd, so the normalized list is
+// rebuilt only when cwd changes.
+let forbiddenPathsCache: { cwd: string; paths: Array<[string, string]> } | undefined;
+
+function getNormalizedForbiddenPaths(): Array<[string, string]> {
+	const cwd = process.cwd();
+	if (forbiddenPathsCache?.cwd !== cwd) {
+		forbiddenPathsCache = {
+			cwd,
+			paths: FORBIDDEN_PATHS.map((p) => [p, normalizeFsPath(p)]),
+		};
+	}
+	return forbiddenPathsCache.paths;
+}
+
+// The module location never changes, so the upward walk only needs to run once.
+let moduleRootCache: string | undefined;
+
 function moduleRootDir(): string {
+	moduleRootCache ??= findModuleRootDir();
+	return moduleRootCache;
+}
+
+function findModuleRootDir(): string {
 	try {
 		const thisFile = fileURLToPath(import.meta.url);
 		// dist/utils/security.js → project root is two levels up from dist
@@ -293,7 +316,34 @@ function getDefaultAllowedRoots(): AllowedRoot[] {
 	return defaults;
 }
 
+// Allowed roots only change when the env allowlist, cwd, home dir or
+// .mcp-allowed-paths.json change, so resolve them once per combination
+// instead of on every validatePath call. The config file is tracked by a
+// single stat, so adding or revoking a root takes effect on the next call.
+let allowedRootsCache: { key: string; roots: AllowedRoot[] } | undefined;
+
+function allowedPathsConfigStamp(): string {
+	const stats = fsSync.statSync(
+		path.join(moduleRootDir(), ".mcp-allowed-paths.json"),
+		{ throwIfNoEntry: false }
+	);
+	return stats ? `${stats.mtimeMs}:${stats.ctimeMs}:${stats.size}:${stats.ino}` : "";
+}
+
 function getAllowedRoots(): AllowedRoot[] {
+	const key = [
+		process.env.MCP_ALLOWED_PATHS ?? "",
+		process.cwd(),
+		process.env[isWindows() ? "USERPROFILE" : "HOME"] ?? "",
+		allowedPathsConfigStamp(),
+	].join("\0");
+	if (allowedRootsCache?.key === key) return allowedRootsCache.roots;
+	const roots = resolveAllowedRoots();
+	allowedRootsCache = { key, roots };
+	return roots;
+}
+
+function resolveAllowedRoots(): AllowedRoot[] {
 	const defaults = getDefaultAllowedRoots();
 	const envRoots = parseAllowedFromEnv();
 	const repoForConfig = defaults[0]?.root ?? moduleRootDir();
@@ -417,6 +467,12 @@ export async function safeWriteFile(
 	return `File written successfully: ${validation.resolvedPath}`;
 }
 
+/**
+ * Environment variable names that may hold secrets, as one alternation so
+ * each key is checked in a single regex pass
+ */
+const SENSITIVE_ENV_KEY = /key|token|secret|password|credential|auth/i;
+
 /**
  * Filter sensitive environment variables
  * Removes API keys, tokens, passwords from environment object
@@ -425,19 +481,10 @@ export async function safeWriteFile(
  */
 export function filterSensitiveEnvironment(): Record<string, string> {
 	const filtered: Record<string, string> = {};
-	const sensitivePatterns = [
-		/key/i,
-		/token/i,
-		/secret/i,
-		/password/i,
-		/credential/i,
-		/auth/i,
-	];
 
 	for (const [key, value] of Object.entries(process.env)) {
 		// Skip if key matches sensitive pattern
-		const isSensitive = sensitivePatterns.some((pattern) => pattern.test(key));
-		if (!isSensitive && value !== undefined) {
+		if (!SENSITIVE_ENV_KEY.test(key) && value !== undefined) {
 			filtered[key] = value;
 		}
 	}
@@ -35,6 +35,18 @@ describe("Cache", () => {
 		expect(cache.get("key1")).toBeUndefined();
 		expect(cache.get("key2")).toBeUndefined();
 	});
+
+	it("should evict the oldest entries beyond maxEntries", () => {
+		const bounded = new Cache<string>(60_000, 2);
+		bounded.set("a", "1");
+		bounded.set("b", "2");
+		bounded.set("c", "3");
+
+		expect(bounded.size()).toBe(2);
+		expect(bounded.get("a")).toBeUndefined();
+		expect(bounded.get("b")).toBe("2");
+		expect(bounded.get("c")).toBe("3");
+	});
 });
 
 describe("RateLimiter", () => {
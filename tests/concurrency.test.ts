@@ -0,0 +1,34 @@
+import { describe, it, expect } from "vitest";
+import { mapSettled } from "../src/utils/concurrency.js";
+
+describe("mapSettled", () => {
+  it("returns outcomes in input order", async () => {
+    const outcomes = await mapSettled([30, 10, 20], 2, async (ms) => {
+      await new Promise((resolve) => setTimeout(resolve, ms));
+      if (ms === 10) throw new Error("boom");
+      return ms * 2;
+    });
+
+    expect(outcomes[0]).toEqual({ status: "fulfilled", value: 60 });
+    expect(outcomes[1]?.status).toBe("rejected");
+    expect((outcomes[1] as PromiseRejectedResult).reason.message).toBe("boom");
+    expect(outcomes[2]).toEqual({ status: "fulfilled", value: 40 });
+  });
+
+  it("never runs more than the limit at once", async () => {
+    let running = 0;
+    let peak = 0;
+    await mapSettled(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      running++;
+      peak = Math.max(peak, running);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      running--;
+    });
+
+    expect(peak).toBe(3);
+  });
+
+  it("handles an empty input", async () => {
+    expect(await mapSettled([], 4, async () => 1)).toEqual([]);
+  });
+});
@@ -20,4 +20,12 @@ describe("Structured Errors", () => {
     expect(out.retryable).toBe(true);
     expect(new Date(out.timestamp).toString()).not.toBe("Invalid Date");
   });
+
+  it("reports timestamps at second granularity", () => {
+    const a = makeStructuredError("a");
+    const b = makeStructuredError("b");
+    const gapMs = Math.abs(Date.parse(a.timestamp) - Date.parse(b.timestamp));
+    expect(gapMs % 1000).toBe(0);
+    expect(a.timestamp.endsWith(".000Z")).toBe(true);
+  });
 });
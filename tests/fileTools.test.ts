@@ -1,7 +1,16 @@
 import { describe, it, expect, beforeEach, afterEach } from "vitest";
-import { readFile, writeFile, mkdir, rm } from "fs/promises";
+import { readFile, writeFile, mkdir, rm, utimes, symlink } from "fs/promises";
 import { join } from "path";
 import { tmpdir } from "os";
+import { execFileSync } from "child_process";
+import { registerFileTools } from "../src/tools/fileTools.js";
+
+class MockServer {
+	tools: Record<string, any> = {};
+	registerTool(name: string, _def: any, handler: any) {
+		this.tools[name] = handler;
+	}
+}
 
 describe("File Operations", () => {
 	let testDir: string;
@@ -45,4 +54,66 @@ describe("File Operations", () => {
 		// Should not throw
 		expect(true).toBe(true);
 	});
+
+	it.skipIf(process.platform === "win32")(
+		"read_file rejects a FIFO without blocking",
+		async () => {
+			const server: any = new MockServer();
+			registerFileTools(server);
+			const fifoPath = join(process.cwd(), `read-fifo-${Date.now()}.tmp`);
+			execFileSync("mkfifo", [fifoPath]);
+			try {
+				const res = await server.tools["read_file"]({ file_path: fifoPath });
+				expect(res.isError).toBe(true);
+				expect(res.content[0].text).toContain("Path is not a file");
+			} finally {
+				await rm(fifoPath, { force: true });
+			}
+		}
+	);
+
+	it("read_file picks up a same-size rewrite with an unchanged mtime", async () => {
+		const server: any = new MockServer();
+		registerFileTools(server);
+		const read = server.tools["read_file"];
+		const filePath = join(process.cwd(), `read-cache-${Date.now()}.tmp`);
+		const past = new Date(Date.now() - 60_000);
+		try {
+			await writeFile(filePath, "aaaa", "utf-8");
+			await utimes(filePath, past, past);
+			expect((await read({ file_path: filePath })).structuredContent.content).toBe("aaaa");
+			expect((await read({ file_path: filePath })).structuredContent.content).toBe("aaaa");
+
+			// Same size and the same mtime as the cached read
+			await writeFile(filePath, "bbbb", "utf-8");
+			await utimes(filePath, past, past);
+			expect((await read({ file_path: filePath })).structuredContent.content).toBe("bbbb");
+
+			// Same size, written just now
+			await writeFile(filePath, "cccc", "utf-8");
+			expect((await read({ file_path: filePath })).structuredContent.content).toBe("cccc");
+		} finally {
+			await rm(filePath, { force: true });
+		}
+	});
+
+	it.skipIf(process.platform === "win32")(
+		"write_file refuses to write through a symlink",
+		async () => {
+			const server: any = new MockServer();
+			registerFileTools(server);
+			const target = join(testDir, "real.txt");
+			await writeFile(target, "original", "utf-8");
+			const linkPath = join(process.cwd(), `write-link-${Date.now()}.tmp`);
+			await symlink(target, linkPath);
+			try {
+				const res = await server.tools["write_file"]({ file_path: linkPath, content: "new" });
+				expect(res.isError).toBe(true);
+				expect(res.content[0].text).toContain("refusing to write through a symlink");
+				expect(await readFile(target, "utf-8")).toBe("original");
+			} finally {
+				await rm(linkPath, { force: true });
+			}
+		}
+	);
 });
@@ -1,5 +1,6 @@
 import { describe, it, expect } from "vitest";
 import path from "path";
+import os from "os";
 import { registerGitTools } from "../src/tools/gitTools.js";
 
 class MockServer {
@@ -21,6 +22,26 @@ describe("gitTools git_command", () => {
     expect(text.toLowerCase()).toContain("git command executed successfully".toLowerCase());
   });
 
+  it("still supports quoted arguments", async () => {
+    const server: any = new MockServer();
+    registerGitTools(server);
+    const run = server.tools["git_command"];
+
+    const res = await run({ git_args: 'log -1 --format="%H"' });
+    expect(res.isError).not.toBe(true);
+    expect(res.structuredContent.output).toMatch(/^[0-9a-f]{40}$/);
+  });
+
+  it.skipIf(process.platform === "win32")("still expands ~ through the shell", async () => {
+    const server: any = new MockServer();
+    registerGitTools(server);
+    const run = server.tools["git_command"];
+
+    const res = await run({ git_args: "rev-parse --sq-quote ~" });
+    expect(res.isError).not.toBe(true);
+    expect(res.structuredContent.output).toBe(`'${os.homedir()}'`);
+  });
+
   it("rejects invalid working directory (forbidden path)", async () => {
     const server: any = new MockServer();
     registerGitTools(server);
@@ -36,3 +57,64 @@ describe("gitTools git_command", () => {
     expect(text).toMatch(/Security Error: Invalid git directory/i);
   });
 });
+
+describe("gitTools git_batch", () => {
+  it("runs commands and returns results in input order", async () => {
+    const server: any = new MockServer();
+    registerGitTools(server);
+    const run = server.tools["git_batch"];
+
+    const res = await run({
+      commands: [
+        { git_args: "rev-parse --is-inside-work-tree" },
+        { git_args: "show not-a-real-revision" },
+        { git_args: "status --short" },
+      ],
+    });
+    const results = res.structuredContent.results;
+    expect(results.map((r: any) => r.git_args)).toEqual([
+      "rev-parse --is-inside-work-tree",
+      "show not-a-real-revision",
+      "status --short",
+    ]);
+    expect(results[0].success).toBe(true);
+    expect(results[0].output).toBe("true");
+    expect(results[1].success).toBe(false);
+    expect(results[2].success).toBe(true);
+    expect(res.isError).not.toBe(true);
+  });
+
+  it("rejects the batch when any command is not read-only", async () => {
+    const server: any = new MockServer();
+    registerGitTools(server);
+    const run = server.tools["git_batch"];
+
+    for (const git_args of [
+      "commit -m x",
+      "status; git add .",
+      "diff --output=out.patch",
+      "grep -Ovim foo",
+      "grep --open-files=vim foo",
+      "log -p --ext-diff",
+      "diff --no-index /etc/passwd README.md",
+      "show --textconv HEAD",
+    ]) {
+      const res = await run({ commands: [{ git_args: "status" }, { git_args }] });
+      expect(res.isError).toBe(true);
+      expect(res.content?.[0]?.text).toMatch(/only runs read-only commands/);
+    }
+  });
+
+  it("rejects the batch when any directory is not allowed", async () => {
+    const server: any = new MockServer();
+    registerGitTools(server);
+    const run = server.tools["git_batch"];
+
+    const invalidCwd = process.platform === "win32"
+      ? path.resolve(process.cwd().split(path.sep)[0] + path.sep, "Windows", "System32")
+      : "/etc";
+    const res = await run({ commands: [{ git_args: "status" }, { git_args: "status", cwd: invalidCwd }] });
+    expect(res.isError).toBe(true);
+    expect(res.content?.[0]?.text).toMatch(/Security Error: Invalid git directory/i);
+  });
+});
@@ -35,6 +35,7 @@ vi.mock("sharp", () => {
       toBuffer: async () => Buffer.from([1, 2, 3]),
       toFile: async (out: string) => {
         await fs.writeFile(out, Buffer.from([1, 2, 3]));
+        return { size: 3 };
       },
       resize: (_opts: any) => api,
     };
@@ -87,4 +88,41 @@ describe("Image Tools (mocked HF + sharp)", () => {
     expect(res).toBeDefined();
     expect(res.content[0].text).toContain("Image conversion complete");
   });
+
+  it("converts every image in a directory batch", async () => {
+    const names = ["a", "b", "c", "d", "e", "f"];
+    for (const name of names) {
+      await writeFile(join(dir, `${name}.png`), Buffer.from([137, 80, 78, 71]));
+    }
+
+    const res: any = await imageConvertTool.handler({
+      input: dir,
+      output_format: "webp",
+    } as any);
+
+    const text = res.content[0].text;
+    expect(text).toContain("Converted: 6 images");
+    expect(text).toContain("Failed: 0");
+    for (const name of names) {
+      expect((await stat(join(dir, "converted", `${name}.webp`))).size).toBe(3);
+    }
+  });
+
+  it("reports batch files that would overwrite the same output", async () => {
+    await mkdir(join(dir, "one"), { recursive: true });
+    await mkdir(join(dir, "two"), { recursive: true });
+    await writeFile(join(dir, "one", "photo.png"), Buffer.from([137, 80, 78, 71]));
+    await writeFile(join(dir, "two", "photo.png"), Buffer.from([137, 80, 78, 71]));
+
+    const res: any = await imageConvertTool.handler({
+      input: dir,
+      output_dir: join(dir, "out"),
+      output_format: "webp",
+    } as any);
+
+    const text = res.content[0].text;
+    expect(text).toContain("Converted: 1 image");
+    expect(text).toContain("Failed: 1");
+    expect(text).toContain("already written from");
+  });
 });
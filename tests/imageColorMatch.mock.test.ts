@@ -53,6 +53,7 @@ vi.mock("sharp", () => {
 			},
 			toFile: async (out: string) => {
 				await fs.writeFile(out, Buffer.from([1, 2, 3]));
+				return { size: 3 };
 			},
 			resize: (_opts: any) => api,
 			stats: async () => ({
@@ -18,6 +18,7 @@ vi.mock("sharp", () => {
       toBuffer: async () => Buffer.from([1, 2, 3]),
       toFile: async (out: string) => {
         await fs.writeFile(out, Buffer.from([1, 2, 3]));
+        return { size: 3 };
       },
       resize: (_opts: any) => api,
     };
@@ -65,4 +66,24 @@ describe("ImageTools additional flows (resize & optimize)", () => {
     expect(res).toBeDefined();
     expect(res.content[0].text).toContain("Image optimization complete");
   });
+
+  it("reports resize and optimize outputs that would collide", async () => {
+    await mkdir(join(dir, "nested"), { recursive: true });
+    await writeFile(join(dir, "nested", "a.jpg"), Buffer.from([255, 216, 255]));
+
+    const resized: any = await imageResizeTool.handler({
+      input: dir,
+      output_dir: join(dir, "resized-out"),
+      width: 100,
+    } as any);
+    expect(resized.content[0].text).toContain("Failed: 1");
+    expect(resized.content[0].text).toContain("already written from");
+
+    const optimized: any = await imageOptimizeTool.handler({
+      input: dir,
+      output_dir: join(dir, "optimized-out"),
+    } as any);
+    expect(optimized.content[0].text).toContain("Failed: 1");
+    expect(optimized.content[0].text).toContain("already written from");
+  });
 });
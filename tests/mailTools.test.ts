@@ -1,4 +1,7 @@
 import { describe, it, expect, vi, afterEach, beforeEach } from "vitest";
+import { mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
 
 describe("Mail tools", () => {
 	beforeEach(() => {
@@ -38,4 +41,38 @@ describe("Mail tools", () => {
 		},
 		10000,
 	);
+
+	it("matches the query case-insensitively and treats it literally", async () => {
+		const dir = await mkdtemp(join(tmpdir(), "mcp-mail-"));
+		const mbox = join(dir, "INBOX");
+		await writeFile(
+			mbox,
+			[
+				"",
+				"From alice@example.com Thu Jan  1 00:00:00 2026",
+				"From: Alice <alice@example.com>",
+				"Subject: Your SERPER API key (new)",
+				"",
+				"Here is your key.",
+				"From bob@example.com Thu Jan  1 00:00:00 2026",
+				"From: Bob <bob@example.com>",
+				"Subject: Lunch",
+				"",
+				"See you at noon.",
+				"",
+			].join("\n"),
+			"utf-8",
+		);
+		try {
+			process.env.MAIL_MBOX_PATH = mbox;
+			const registered = await getHandlers();
+			const res: any = await registered["mail_search"]({ query: "serper api key (NEW)" });
+			const text = String(res.content[0].text);
+			expect(text).toContain("Found 1 email(s)");
+			expect(text).toContain("Alice");
+			expect(text).not.toContain("Lunch");
+		} finally {
+			await rm(dir, { recursive: true, force: true });
+		}
+	});
 });
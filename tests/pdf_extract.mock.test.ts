@@ -39,4 +39,23 @@ describe("PDF extract local error handling", () => {
 		expect(res.isError).toBe(true);
 		expect(res.content[0].text).toMatch(/Failed to extract receipt data locally/i);
 	});
+
+	it("rejects files without a PDF header before parsing", async () => {
+		const registered: Record<string, Function> = {};
+		const fakeServer: any = {
+			registerTool: (name: string, _opts: any, handler: Function) => {
+				registered[name] = handler;
+			},
+		};
+
+		registerPDFTools(fakeServer);
+		const handler = registered["pdf_extract_text"];
+
+		const notPdf = join(dir, "photo.pdf");
+		await writeFile(notPdf, Buffer.from([0xff, 0xd8, 0xff, 0xe0, 0x00, 0x10]));
+
+		const res: any = await handler({ file_path: notPdf });
+		expect(res.isError).toBe(true);
+		expect(res.content[0].text).toMatch(/Not a PDF file/);
+	});
 });
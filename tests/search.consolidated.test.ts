@@ -43,6 +43,44 @@ describe("Consolidated search tool", () => {
 		expect(res.content[0].text).toContain("duckduckgo");
 	});
 
+	it("stops parsing DDG results once count is reached", async () => {
+		process.env.TAVILY_API_KEY = "";
+		process.env.SERPER_API_KEY = "";
+
+		const block = (n: number) =>
+			`<div class="result__body"><a rel="nofollow" href="https://r${n}.com">R${n}</a><a class="result__snippet">s${n}</a></div>`;
+		globalThis.fetch = vi.fn().mockResolvedValue({
+			ok: true,
+			text: async () => `<html>${block(1)}${block(2)}${block(3)}</html>`,
+		});
+
+		const handler = await getHandler();
+		const res: any = await handler({ query: "limited", count: 2 });
+		const results = JSON.parse(res.content[0].text.split("\n").slice(1).join("\n"));
+		expect(results.map((r: any) => r.url)).toEqual(["https://r1.com", "https://r2.com"]);
+	});
+
+	it("shares one provider call between concurrent identical searches", async () => {
+		process.env.SERPER_API_KEY = "serper-test-key";
+
+		const fetchMock = vi.fn().mockResolvedValue({
+			ok: true,
+			text: async () =>
+				JSON.stringify({
+					organic: [{ title: "S", link: "https://s.com", snippet: "s" }],
+				}),
+		});
+		globalThis.fetch = fetchMock;
+
+		const handler = await getHandler();
+		const [first, second]: any[] = await Promise.all([
+			handler({ query: "concurrent", provider: "serper" }),
+			handler({ query: "concurrent", provider: "serper" }),
+		]);
+		expect(second.content[0].text).toBe(first.content[0].text);
+		expect(fetchMock).toHaveBeenCalledTimes(1);
+	});
+
 	it("uses forced serper provider", async () => {
 		process.env.SERPER_API_KEY = "serper-test-key";
 
@@ -74,4 +112,57 @@ describe("Consolidated search tool", () => {
 		const res: any = await handler({ query: "test", provider: "tavily" });
 		expect(res.content[0].text).toContain("tavily");
 	});
+
+	it("serves repeat searches from cache", async () => {
+		process.env.SERPER_API_KEY = "serper-test-key";
+
+		const fetchMock = vi.fn().mockResolvedValue({
+			ok: true,
+			text: async () =>
+				JSON.stringify({
+					organic: [{ title: "S", link: "https://s.com", snippet: "s" }],
+				}),
+		});
+		globalThis.fetch = fetchMock;
+
+		const handler = await getHandler();
+		const first: any = await handler({ query: "cached", provider: "serper" });
+		const second: any = await handler({ query: "cached", provider: "serper" });
+		expect(second.content[0].text).toBe(first.content[0].text);
+		expect(fetchMock).toHaveBeenCalledTimes(1);
+
+		await handler({ query: "cached", provider: "serper", count: 5 });
+		expect(fetchMock).toHaveBeenCalledTimes(2);
+	});
+
+	it("does not cache a fallback reached because a provider errored", async () => {
+		process.env.TAVILY_API_KEY = "";
+		process.env.SERPER_API_KEY = "serper-test-key";
+
+		const fetchMock = vi
+			.fn()
+			.mockRejectedValueOnce(new Error("serper down"))
+			.mockResolvedValueOnce({
+				ok: true,
+				text: async () =>
+					`<html><div class="result__body"><a rel="nofollow" href="https://d.com">D</a></div></html>`,
+			})
+			.mockResolvedValue({
+				ok: true,
+				text: async () =>
+					JSON.stringify({
+						organic: [{ title: "S", link: "https://s.com", snippet: "s" }],
+					}),
+			});
+		globalThis.fetch = fetchMock;
+		vi.spyOn(console, "error").mockImplementation(() => {});
+
+		const handler = await getHandler();
+		const first: any = await handler({ query: "flaky" });
+		expect(first.content[0].text).toContain("Results from duckduckgo");
+
+		const second: any = await handler({ query: "flaky" });
+		expect(second.content[0].text).toContain("Results from serper");
+		expect(fetchMock).toHaveBeenCalledTimes(3);
+	});
 });
@@ -3,8 +3,11 @@ import {
 	validatePath,
 	validateCommand,
 	getSecurityConfig,
+	safeReadFile,
+	filterSensitiveEnvironment,
 } from "../src/utils/security.js";
 import { join } from "path";
+import { readFile, rm, writeFile } from "fs/promises";
 
 describe("Security Validation", () => {
 	describe("validatePath", () => {
@@ -112,6 +115,41 @@ describe("Security Validation", () => {
 			expect(result.valid).toBe(true);
 			expect(result.resolvedPath).toContain("src");
 		});
+
+		it("should pick up MCP_ALLOWED_PATHS changes between calls", () => {
+			const extraRoot = process.platform === "win32" ? "C:\\mcp-extra-root" : "/mcp-extra-root";
+			const target = join(extraRoot, "file.txt");
+			const previous = process.env.MCP_ALLOWED_PATHS;
+			try {
+				delete process.env.MCP_ALLOWED_PATHS;
+				expect(validatePath(target).valid).toBe(false);
+				process.env.MCP_ALLOWED_PATHS = `ro:${extraRoot}`;
+				expect(validatePath(target).valid).toBe(true);
+				expect(validatePath(target, "write").valid).toBe(false);
+			} finally {
+				if (previous === undefined) delete process.env.MCP_ALLOWED_PATHS;
+				else process.env.MCP_ALLOWED_PATHS = previous;
+			}
+		});
+
+		it("should pick up a root revoked in .mcp-allowed-paths.json", async () => {
+			const extraRoot = process.platform === "win32" ? "C:\\mcp-config-root" : "/mcp-config-root";
+			const target = join(extraRoot, "file.txt");
+			// The config lives at the repo root, so keep any developer copy and
+			// put it back afterwards rather than deleting it
+			const configPath = join(process.cwd(), ".mcp-allowed-paths.json");
+			const original = await readFile(configPath).catch(() => undefined);
+			try {
+				await writeFile(configPath, JSON.stringify({ paths: [{ path: extraRoot, mode: "ro" }] }));
+				expect(validatePath(target).valid).toBe(true);
+
+				await writeFile(configPath, JSON.stringify({ paths: [] }));
+				expect(validatePath(target).valid).toBe(false);
+			} finally {
+				if (original === undefined) await rm(configPath, { force: true });
+				else await writeFile(configPath, original);
+			}
+		});
 	});
 
 	describe("validateCommand", () => {
@@ -205,6 +243,22 @@ describe("Security Validation", () => {
 		});
 	});
 
+	describe("safeReadFile", () => {
+		it("should return fresh content after the file changes", async () => {
+			const testPath = join(process.cwd(), `safe-read-${Date.now()}.tmp`);
+			try {
+				await writeFile(testPath, "first", "utf-8");
+				expect(await safeReadFile(testPath)).toBe("first");
+				expect(await safeReadFile(testPath)).toBe("first");
+
+				await writeFile(testPath, "second version", "utf-8");
+				expect(await safeReadFile(testPath)).toBe("second version");
+			} finally {
+				await rm(testPath, { force: true });
+			}
+		});
+	});
+
 	describe("getSecurityConfig", () => {
 		it("should return security configuration", () => {
 			const config = getSecurityConfig();
@@ -241,4 +295,19 @@ describe("Security Validation", () => {
 			expect(hasSystemDirs).toBe(true);
 		});
 	});
+
+	describe("filterSensitiveEnvironment", () => {
+		it("should drop secret-looking variables and keep the rest", () => {
+			process.env.TEST_API_TOKEN = "hidden";
+			process.env.TEST_PLAIN_SETTING = "visible";
+			try {
+				const filtered = filterSensitiveEnvironment();
+				expect(filtered.TEST_API_TOKEN).toBeUndefined();
+				expect(filtered.TEST_PLAIN_SETTING).toBe("visible");
+			} finally {
+				delete process.env.TEST_API_TOKEN;
+				delete process.env.TEST_PLAIN_SETTING;
+			}
+		});
+	});
 });